@@ -0,0 +1,105 @@
+"""scope task full text search by user
+
+Revision ID: 02f8976793b4
+Revises: aebc190d85df
+Create Date: 2026-10-18 14:32:17.064112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '02f8976793b4'
+down_revision: Union[str, None] = 'aebc190d85df'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# owner_id and assignee_id are indexed as tokens, so a search matches the words
+# and the user together and only the user's tasks are ranked. The 1 character
+# prefix index serves the first keystrokes without merging every term.
+FTS_TABLE = """
+    CREATE VIRTUAL TABLE task_fts USING fts5(
+        name, notes, owner_id, assignee_id,
+        content='task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='1 2 3'
+    )
+"""
+FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts(rowid, name, notes, owner_id, assignee_id)
+        VALUES (new.id, new.name, new.notes, new.owner_id, new.assignee_id);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes, owner_id, assignee_id)
+        VALUES ('delete', old.id, old.name, old.notes, old.owner_id, old.assignee_id);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF name, notes, owner_id, assignee_id ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes, owner_id, assignee_id)
+        VALUES ('delete', old.id, old.name, old.notes, old.owner_id, old.assignee_id);
+        INSERT INTO task_fts(rowid, name, notes, owner_id, assignee_id)
+        VALUES (new.id, new.name, new.notes, new.owner_id, new.assignee_id);
+    END
+    """,
+)
+
+# The index of revision 73cacacd87f9
+OLD_FTS_TABLE = """
+    CREATE VIRTUAL TABLE task_fts USING fts5(
+        name, notes,
+        content='task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+"""
+OLD_FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF name, notes ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+        INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+    END
+    """,
+)
+
+
+def drop_fts() -> None:
+    op.execute("DROP TRIGGER IF EXISTS task_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS task_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS task_fts_insert")
+    op.execute("DROP TABLE IF EXISTS task_fts")
+
+
+def create_fts(table: str, triggers: tuple[str, ...]) -> None:
+    op.execute(table)
+    for trigger in triggers:
+        op.execute(trigger)
+    op.execute("INSERT INTO task_fts(task_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    drop_fts()
+    create_fts(FTS_TABLE, FTS_TRIGGERS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_fts()
+    create_fts(OLD_FTS_TABLE, OLD_FTS_TRIGGERS)
@@ -0,0 +1,81 @@
+"""add task assignee id
+
+Revision ID: 60a3cd1a2c84
+Revises: 73cacacd87f9
+Create Date: 2026-10-18 13:34:16.518210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '60a3cd1a2c84'
+down_revision: Union[str, None] = '73cacacd87f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Recreating task in batch mode drops its triggers, see revision 73cacacd87f9.
+FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF name, notes ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+        INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+    END
+    """,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('assignee_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_task_assignee_id_user', 'user', ['assignee_id'], ['id'])
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_assignee_id_date', ['assignee_id', 'date'], unique=False)
+
+    # Point each task at the user its assigned_to names; other names stay NULL.
+    task = sa.table(
+        'task',
+        sa.column('assignee_id', sa.Integer()),
+        sa.column('assigned_to', sa.String()),
+    )
+    user = sa.table(
+        'user',
+        sa.column('id', sa.Integer()),
+        sa.column('username', sa.String()),
+    )
+    op.get_bind().execute(
+        task.update().values(
+            assignee_id=sa.select(user.c.id)
+            .where(user.c.username == task.c.assigned_to)
+            .scalar_subquery()
+        )
+    )
+
+    for trigger in FTS_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_assignee_id_date')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_task_assignee_id_user', type_='foreignkey')
+        batch_op.drop_column('assignee_id')
+
+    for trigger in FTS_TRIGGERS:
+        op.execute(trigger)
@@ -0,0 +1,30 @@
+"""add task owner date index
+
+Revision ID: 639498287205
+Revises: ce0422098fbb
+Create Date: 2026-10-18 11:26:05.381940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '639498287205'
+down_revision: Union[str, None] = 'ce0422098fbb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_owner_id_date', ['owner_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_owner_id_date')
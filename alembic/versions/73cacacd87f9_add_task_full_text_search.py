@@ -0,0 +1,56 @@
+"""add task full text search
+
+Revision ID: 73cacacd87f9
+Revises: 639498287205
+Create Date: 2026-10-18 12:40:52.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '73cacacd87f9'
+down_revision: Union[str, None] = '639498287205'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # External content FTS5 index over task.name and task.notes, keyed by task.id.
+    op.execute("""
+        CREATE VIRTUAL TABLE task_fts USING fts5(
+            name, notes,
+            content='task', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+            INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+            INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER task_fts_update AFTER UPDATE OF name, notes ON task BEGIN
+            INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+            INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+        END
+    """)
+    op.execute("INSERT INTO task_fts(task_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS task_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS task_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS task_fts_insert")
+    op.execute("DROP TABLE IF EXISTS task_fts")
@@ -0,0 +1,40 @@
+"""add task counts
+
+Revision ID: aebc190d85df
+Revises: c29a7a66066a
+Create Date: 2026-10-18 13:45:06.275750
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aebc190d85df'
+down_revision: Union[str, None] = 'c29a7a66066a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows are filled in by the reconciliation task or on each user's first read.
+    op.create_table(
+        'task_counts',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('not_started', sa.Integer(), nullable=False),
+        sa.Column('in_progress', sa.Integer(), nullable=False),
+        sa.Column('completed', sa.Integer(), nullable=False),
+        sa.Column('overdue', sa.Integer(), nullable=False),
+        sa.Column('due_soon', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('task_counts')
@@ -0,0 +1,32 @@
+"""add task owner indexes
+
+Revision ID: ba82ba9baf9c
+Revises: f1aa69ee6f3d
+Create Date: 2026-10-18 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'ba82ba9baf9c'
+down_revision: Union[str, None] = 'f1aa69ee6f3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_task_owner_id'), ['owner_id'], unique=False)
+        batch_op.create_index('ix_task_owner_id_status_date', ['owner_id', 'status', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_owner_id_status_date')
+        batch_op.drop_index(batch_op.f('ix_task_owner_id'))
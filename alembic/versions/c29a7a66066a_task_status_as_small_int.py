@@ -0,0 +1,110 @@
+"""task status as small int
+
+Revision ID: c29a7a66066a
+Revises: 60a3cd1a2c84
+Create Date: 2026-10-18 13:38:39.730098
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'c29a7a66066a'
+down_revision: Union[str, None] = '60a3cd1a2c84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Status labels by their stored value, as in my_todo.models.STATUS_LABELS.
+STATUS_LABELS = {1: 'Not Started', 2: 'In Progress', 3: 'Completed'}
+
+# Recreating task in batch mode drops its triggers, see revision 73cacacd87f9.
+FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER task_fts_update AFTER UPDATE OF name, notes ON task BEGIN
+        INSERT INTO task_fts(task_fts, rowid, name, notes) VALUES ('delete', old.id, old.name, old.notes);
+        INSERT INTO task_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes);
+    END
+    """,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    task_status = op.create_table(
+        'task_status',
+        sa.Column('id', sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column('label', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('label'),
+    )
+    op.bulk_insert(task_status, [{'id': id, 'label': label} for id, label in STATUS_LABELS.items()])
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_owner_id_status_date')
+        batch_op.add_column(sa.Column('status_code', sa.SmallInteger(), nullable=True))
+
+    # Map labels to their value; unknown labels become Not Started.
+    conn = op.get_bind()
+    unknown = conn.execute(sa.text(
+        "SELECT COUNT(*) FROM task WHERE status NOT IN (SELECT label FROM task_status)"
+    )).scalar()
+    conn.execute(sa.text(
+        "UPDATE task SET status_code = "
+        "COALESCE((SELECT id FROM task_status WHERE label = task.status), 1)"
+    ))
+    if unknown:
+        print(f"{unknown} task(s) had an unknown status; set to Not Started")
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_column('status')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.alter_column(
+            'status_code', new_column_name='status', existing_type=sa.SmallInteger(), nullable=False
+        )
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_foreign_key('fk_task_status_task_status', 'task_status', ['status'], ['id'])
+        batch_op.create_check_constraint('ck_task_status', 'status IN (1, 2, 3)')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_owner_id_status_date', ['owner_id', 'status', 'date'], unique=False)
+
+    for trigger in FTS_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_owner_id_status_date')
+        batch_op.drop_constraint('ck_task_status', type_='check')
+        batch_op.drop_constraint('fk_task_status_task_status', type_='foreignkey')
+        batch_op.alter_column('status', new_column_name='status_code')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+    conn = op.get_bind()
+    conn.execute(sa.text(
+        "UPDATE task SET status = (SELECT label FROM task_status WHERE id = task.status_code)"
+    ))
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.alter_column('status', existing_type=sqlmodel.sql.sqltypes.AutoString(), nullable=False)
+        batch_op.drop_column('status_code')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_owner_id_status_date', ['owner_id', 'status', 'date'], unique=False)
+    op.drop_table('task_status')
+
+    for trigger in FTS_TRIGGERS:
+        op.execute(trigger)
@@ -0,0 +1,93 @@
+"""task date as date column
+
+Revision ID: ce0422098fbb
+Revises: ba82ba9baf9c
+Create Date: 2026-10-18 10:02:17.224391
+
+"""
+from datetime import date, datetime
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'ce0422098fbb'
+down_revision: Union[str, None] = 'ba82ba9baf9c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Formats accepted for existing free-form dates, in order of preference.
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%d.%m.%Y")
+
+
+def parse_legacy_date(value: str) -> Optional[date]:
+    """Parse a free-form task date, returning None if it is not a date."""
+    value = (value or "").strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_owner_id_status_date')
+        batch_op.add_column(sa.Column('due_date', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('legacy_date', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+    # Convert existing rows, keeping unparsable values in legacy_date.
+    conn = op.get_bind()
+    task = sa.table(
+        'task',
+        sa.column('id', sa.Integer()),
+        sa.column('date', sa.String()),
+        sa.column('due_date', sa.Date()),
+        sa.column('legacy_date', sa.String()),
+    )
+    invalid = 0
+    for task_id, raw in conn.execute(sa.select(task.c.id, task.c.date)).all():
+        parsed = parse_legacy_date(raw)
+        if parsed is None:
+            invalid += 1
+        conn.execute(
+            task.update()
+            .where(task.c.id == task_id)
+            .values(due_date=parsed, legacy_date=None if parsed else raw)
+        )
+    if invalid:
+        print(f"{invalid} task(s) had unparsable dates; kept in task.legacy_date")
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_column('date')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.alter_column('due_date', new_column_name='date')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_owner_id_status_date', ['owner_id', 'status', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_owner_id_status_date')
+        batch_op.alter_column('date', new_column_name='due_date')
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('date', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+    conn = op.get_bind()
+    conn.execute(sa.text(
+        "UPDATE task SET date = COALESCE(legacy_date, CAST(due_date AS TEXT), '')"
+    ))
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.alter_column('date', existing_type=sqlmodel.sql.sqltypes.AutoString(), nullable=False)
+        batch_op.drop_column('legacy_date')
+        batch_op.drop_column('due_date')
+        batch_op.create_index('ix_task_owner_id_status_date', ['owner_id', 'status', 'date'], unique=False)
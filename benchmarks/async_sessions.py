@@ -0,0 +1,121 @@
+"""Benchmark sync vs async database sessions inside event handlers.
+
+Simulates --clients concurrent handlers on one event loop, each running a
+task query and a commit, first through a sync Session (as rx.session() does)
+and then through an AsyncSession (as rx.asession() does). Reports handler
+throughput and the worst event loop stall seen by a 5 ms ticker, which is how
+long every other websocket on the worker would have waited.
+
+Usage:
+    python benchmarks/async_sessions.py --clients 50 --rows 200000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Reflex has to be imported before sqlmodel, so load the app module first.
+from my_todo.db import create_async_engine, create_engine  # noqa: E402
+
+import sqlalchemy as sa  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+TICK = 0.005
+
+QUERY = sa.text(
+    "SELECT * FROM task WHERE owner_id = :owner AND notes LIKE :notes ORDER BY date LIMIT 50"
+)
+UPDATE = sa.text("UPDATE task SET status = 'In Progress' WHERE id = :id")
+
+
+async def ticker(stop: asyncio.Event) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        worst = max(worst, time.perf_counter() - start - TICK)
+    return worst
+
+
+def setup(path: str, rows: int, owners: int):
+    engine = create_engine(f"sqlite:///{path}")
+    rng = random.Random(0)
+    with engine.begin() as conn:
+        conn.execute(sa.text(
+            "CREATE TABLE task (id INTEGER PRIMARY KEY, name VARCHAR, date DATE, "
+            "notes VARCHAR, status VARCHAR, owner_id INTEGER)"
+        ))
+        conn.execute(sa.text("CREATE INDEX ix_task_owner_id ON task (owner_id)"))
+        conn.execute(
+            sa.text("INSERT INTO task (name, date, notes, status, owner_id) VALUES (:name, :date, :notes, 'Not Started', :owner)"),
+            [
+                {
+                    "name": f"Task {i}",
+                    "date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    "notes": " ".join(rng.choice(["alpha", "beta", "gamma", "delta"]) for _ in range(8)),
+                    "owner": rng.randint(1, owners),
+                }
+                for i in range(rows)
+            ],
+        )
+    engine.dispose()
+
+
+async def run(mode: str, path: str, clients: int, rows: int, owners: int) -> tuple[float, float]:
+    rng = random.Random(1)
+    if mode == "sync":
+        engine = create_engine(f"sqlite:///{path}")
+
+        async def handler():
+            # A sync session blocks the loop for the whole query and commit
+            with Session(engine) as session:
+                session.exec(QUERY, params={"owner": rng.randint(1, owners), "notes": "%gamma delta%"}).all()
+                session.exec(UPDATE, params={"id": rng.randint(1, rows)})
+                session.commit()
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+        async def handler():
+            async with AsyncSession(engine) as session:
+                (await session.exec(QUERY, params={"owner": rng.randint(1, owners), "notes": "%gamma delta%"})).all()
+                await session.exec(UPDATE, params={"id": rng.randint(1, rows)})
+                await session.commit()
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(ticker(stop))
+    await asyncio.sleep(TICK)
+    start = time.perf_counter()
+    await asyncio.gather(*(handler() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    worst = await lag_task
+    if mode == "sync":
+        engine.dispose()
+    else:
+        await engine.dispose()
+    return clients / elapsed, worst * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--owners", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        setup(path, args.rows, args.owners)
+        for mode in ("sync", "async"):
+            throughput, lag = asyncio.run(run(mode, path, args.clients, args.rows, args.owners))
+            print(f"{mode:<6} {throughput:8.1f} handlers/s  worst loop stall {lag:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
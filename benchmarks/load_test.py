@@ -0,0 +1,323 @@
+"""Load test a running backend with simulated dashboard sessions over websockets.
+
+Starts --clients Socket.IO clients against a ``reflex run`` backend. Each one
+hydrates, logs in as a manager, switches to the Manager role and then, until
+--seconds have passed, repeats a random mix of dashboard actions with
+exponential think times of mean --think-ms:
+
+- scroll: page through current_tasks with next_page / prev_page
+- search: type a word into the search box one key at a time, then clear it
+- edit: open the edit modal and submit it (the modal is an uncontrolled form,
+  so typing in it sends no events)
+- add: add a task, later deleted again by the same client
+- delete: delete a task the client added
+
+Every event is timed from sending it to the update marked final. Events the
+backend returns for the client to send next are then sent and timed in turn,
+like the browser's event queue does, except watch_task_changes unless --watch
+is given: its pushes of other clients' changes are indistinguishable from
+event replies and end waits early, which also leaves some added tasks (named
+"Load test ...") undeleted.
+
+Prints one JSON object with p50/p95/p99 latency overall and per event, events
+per second, errors and the backend's RSS before and after the clients logged
+in (found by --port, or given with --backend-pid). Use --output to append it
+to a JSON Lines file to track runs across commits.
+
+Seed a database whose first users are managers, then start the backend:
+
+    python -m my_todo.seed todo.db --users 100 --tasks 100000 --seed 1
+    reflex run --env prod --backend-only
+
+Usage:
+    python benchmarks/load_test.py --clients 50 --seconds 60 --accounts 10
+
+Needs the asyncio Socket.IO client: pip install "python-socketio[asyncio_client]"
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import psutil  # noqa: E402
+import socketio  # noqa: E402
+
+# Actions and their relative weights
+ACTIONS = {"scroll": 40, "search": 20, "edit": 20, "add": 10, "delete": 10}
+
+ROUTER_DATA = {"pathname": "/", "query": {}, "asPath": "/"}
+
+# Socket.IO path and namespace of the backend's event endpoint
+EVENT_NAMESPACE = "/_event"
+
+SEARCH_WORDS = ["review", "report", "budget", "release", "client", "deploy"]
+
+
+def event_names() -> dict[str, str]:
+    """Map the handlers the clients call to their full event names."""
+    import reflex as rx
+    import my_todo.my_todo as app_module
+
+    names = {"hydrate": f"{rx.State.get_full_name()}.hydrate"}
+    for cls, handlers in (
+        (app_module.AuthState, ["login"]),
+        (app_module.RoleModalState, ["set_role", "set_role_password", "verify_role_password"]),
+        (app_module.TaskListState, ["next_page", "prev_page", "set_search_query", "add_item", "delete_item"]),
+        (app_module.EditTaskState, ["open_edit_modal", "edit_item"]),
+    ):
+        for handler in handlers:
+            names[handler] = f"{cls.get_full_name()}.{handler}"
+    return names
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(q) - 1]
+
+
+def latency_summary(values: list[float]) -> dict[str, float]:
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(max(values, default=0.0) * 1000, 2),
+    }
+
+
+def backend_pid(port: int) -> Optional[int]:
+    """Return the pid of the process listening on a local port."""
+    for conn in psutil.net_connections(kind="tcp"):
+        if conn.status == psutil.CONN_LISTEN and conn.laddr.port == port and conn.pid:
+            return conn.pid
+    return None
+
+
+def rss_mib(pid: Optional[int]) -> Optional[float]:
+    """Return the RSS of a process and its children, in MiB."""
+    if pid is None:
+        return None
+    try:
+        process = psutil.Process(pid)
+        processes = [process, *process.children(recursive=True)]
+        return round(sum(p.memory_info().rss for p in processes) / 2**20, 1)
+    except psutil.Error:
+        return None
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Client:
+    """One simulated browser session."""
+
+    def __init__(self, url: str, names: dict[str, str], args, number: int, latencies: dict[str, list[float]]):
+        self.url = url
+        self.names = names
+        self.args = args
+        self.username = f"{args.prefix}{number % args.accounts + 1}"
+        self.rng = random.Random(args.seed * 100_003 + number)
+        self.latencies = latencies
+        self.errors = 0
+        self.token = str(uuid.uuid4())
+        self.state: dict[str, dict[str, Any]] = {}
+        self.added_ids: list[int] = []
+        # Events returned by the backend, to send after the current one
+        self.chained: list[tuple[str, dict]] = []
+        self.final = asyncio.Event()
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.sio.on("event", self.on_update, namespace=EVENT_NAMESPACE)
+
+    async def on_update(self, update: dict):
+        for state_name, delta in (update.get("delta") or {}).items():
+            self.state.setdefault(state_name, {}).update(delta)
+        for event in update.get("events") or []:
+            name = event.get("name", "")
+            # Names starting with "_" are frontend events (redirects, toasts, ...)
+            if name.startswith("_") or (name.endswith(".watch_task_changes") and not self.args.watch):
+                continue
+            self.chained.append((name, event.get("payload") or {}))
+        if update.get("final", True):
+            self.final.set()
+
+    def event(self, name: str, payload: dict) -> dict:
+        return {"token": self.token, "name": name, "payload": payload, "router_data": ROUTER_DATA}
+
+    def var(self, name: str, default: Any = None) -> Any:
+        """Return the last value of a state var from any substate."""
+        for delta in self.state.values():
+            if name in delta:
+                return delta[name]
+        return default
+
+    async def send(self, handler: str, **payload):
+        """Send an event and the events chained to it, waiting for each one's final update."""
+        await self.send_event(handler, self.names[handler], payload)
+        while self.chained:
+            name, chained_payload = self.chained.pop(0)
+            await self.send_event(name.rpartition(".")[2], name, chained_payload)
+
+    async def send_event(self, handler: str, name: str, payload: dict):
+        self.final.clear()
+        start = time.perf_counter()
+        await self.sio.emit("event", self.event(name, payload), namespace=EVENT_NAMESPACE)
+        try:
+            await asyncio.wait_for(self.final.wait(), self.args.timeout)
+        except asyncio.TimeoutError:
+            self.errors += 1
+            return
+        self.latencies[handler].append(time.perf_counter() - start)
+
+    async def start(self):
+        await self.sio.connect(
+            self.url, socketio_path=EVENT_NAMESPACE, transports=["websocket"], namespaces=[EVENT_NAMESPACE]
+        )
+        await self.send("hydrate")
+        await self.send("login", form_data={"username": self.username, "password": self.args.password})
+        await self.send("set_role", role="Manager")
+        await self.send("set_role_password", password=self.args.password)
+        await self.send("verify_role_password")
+
+    async def run(self, deadline: float):
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.rng.expovariate(1000 / self.args.think_ms))
+            action = self.rng.choices(list(ACTIONS), list(ACTIONS.values()))[0]
+            await getattr(self, action)()
+
+    async def scroll(self):
+        if self.var("has_next_page"):
+            await self.send("next_page")
+        elif (self.var("page") or 1) > 1:
+            await self.send("prev_page")
+
+    async def search(self):
+        word = self.rng.choice(SEARCH_WORDS)
+        for i in range(1, len(word) + 1):
+            await self.send("set_search_query", search_query=word[:i])
+        await self.send("set_search_query", search_query="")
+
+    async def edit(self):
+        tasks = self.var("current_tasks") or []
+        if not tasks:
+            return
+        task = self.rng.choice(tasks)
+        await self.send("open_edit_modal", task=task)
+        await asyncio.sleep(self.rng.expovariate(1000 / self.args.think_ms))
+        await self.send("edit_item", form_data={
+            "name": task["name"],
+            "date": task.get("date") or "",
+            "notes": f"{task['notes']} (edited)"[-200:],
+            "status": self.rng.choice(["Not Started", "In Progress", "Completed"]),
+            "assigned_to": task["assigned_to"],
+        })
+
+    async def add(self):
+        name = f"Load test {uuid.uuid4().hex[:8]}"
+        await self.send("add_item", form_data={
+            "name": name,
+            "date": time.strftime("%Y-%m-%d"),
+            "notes": "Added by benchmarks/load_test.py",
+            "status": "Not Started",
+            "assigned_to": self.username,
+        })
+        self.added_ids.extend(task["id"] for task in self.var("current_tasks") or [] if task["name"] == name)
+
+    async def delete(self):
+        if self.added_ids:
+            await self.send("delete_item", task_id=self.added_ids.pop())
+
+    async def close(self):
+        # Leave the dataset as it was
+        while self.added_ids:
+            await self.delete()
+        await self.sio.disconnect()
+
+
+async def run(args) -> dict[str, Any]:
+    names = event_names()
+    pid = args.backend_pid or backend_pid(args.port)
+    url = f"http://{args.host}:{args.port}"
+    latencies: dict[str, list[float]] = defaultdict(list)
+
+    rss_before = rss_mib(pid)
+    clients = [Client(url, names, args, number, latencies) for number in range(args.clients)]
+    await asyncio.gather(*(client.start() for client in clients))
+    rss_logged_in = rss_mib(pid)
+    login_latencies = {name: list(values) for name, values in latencies.items()}
+    latencies.clear()
+
+    start = time.monotonic()
+    await asyncio.gather(*(client.run(start + args.seconds) for client in clients))
+    elapsed = time.monotonic() - start
+    rss_after = rss_mib(pid)
+    await asyncio.gather(*(client.close() for client in clients))
+
+    measured = [value for values in latencies.values() for value in values]
+    per_session = None
+    if rss_before is not None and rss_logged_in is not None:
+        per_session = round((rss_logged_in - rss_before) * 1024 / args.clients, 1)
+    return {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "clients": args.clients,
+        "seconds": round(elapsed, 1),
+        "think_ms": args.think_ms,
+        "watch": args.watch,
+        "events": len(measured),
+        "events_per_sec": round(len(measured) / elapsed, 1),
+        "errors": sum(client.errors for client in clients),
+        "latency": latency_summary(measured),
+        "by_event": {name: latency_summary(values) for name, values in sorted(latencies.items())},
+        "login": {name: latency_summary(values) for name, values in sorted(login_latencies.items())},
+        "backend_pid": pid,
+        "backend_rss_mib": {"before": rss_before, "logged_in": rss_logged_in, "after": rss_after},
+        "backend_rss_kib_per_session": per_session,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8000, help="backend port")
+    parser.add_argument("--backend-pid", type=int, default=None, help="default: the process listening on --port")
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--think-ms", type=float, default=200)
+    parser.add_argument("--timeout", type=float, default=30, help="seconds to wait for an event's final update")
+    parser.add_argument("--accounts", type=int, default=10, help="log in as prefix1 .. prefixN, which must be managers")
+    parser.add_argument("--prefix", default="user")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--watch", action="store_true", help="run watch_task_changes in every session")
+    parser.add_argument("--output", help="append the result to this JSON Lines file")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "a") as out:
+            out.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
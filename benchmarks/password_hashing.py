@@ -0,0 +1,76 @@
+"""Benchmark concurrent logins at different scrypt cost settings.
+
+Each run verifies --clients passwords concurrently on one event loop, either
+inline (blocking the loop) or in a thread pool, and reports login throughput
+and the worst event loop stall seen by a 5 ms ticker.
+
+Usage:
+    python benchmarks/password_hashing.py --costs 4096 16384 32768 --clients 32
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from my_todo.auth import hash_password, verify_password  # noqa: E402
+
+TICK = 0.005
+
+
+async def ticker(stop: asyncio.Event) -> float:
+    """Return the largest delay between scheduled and actual wakeups."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        worst = max(worst, time.perf_counter() - start - TICK)
+    return worst
+
+
+async def run(stored: str, clients: int, workers: int) -> tuple[float, float]:
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=workers) if workers else None
+
+    async def login() -> bool:
+        if executor is None:
+            return verify_password("correct horse", stored)
+        return await loop.run_in_executor(executor, verify_password, "correct horse", stored)
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(ticker(stop))
+    await asyncio.sleep(TICK)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    worst_lag = await lag_task
+    if executor is not None:
+        executor.shutdown()
+    assert all(results)
+    return clients / elapsed, worst_lag * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--costs", type=int, nargs="+", default=[4096, 16384, 32768])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 4])
+    args = parser.parse_args()
+
+    for n in args.costs:
+        stored = hash_password("correct horse", cost=(n, 8, 1))
+        for workers in args.workers:
+            throughput, lag = asyncio.run(run(stored, args.clients, workers))
+            mode = "inline" if workers == 0 else f"{workers} thread(s)"
+            print(
+                f"n={n:<6} {mode:<12} {throughput:8.1f} logins/s  "
+                f"worst loop stall {lag:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
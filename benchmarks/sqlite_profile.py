@@ -0,0 +1,114 @@
+"""Benchmark concurrent task reads and writes under each db_profile.
+
+Runs --writers threads inserting and updating tasks and --readers threads
+querying a user's tasks against a fresh SQLite file, for --seconds per
+profile, and reports throughput and "database is locked" errors.
+
+Usage:
+    python benchmarks/sqlite_profile.py --readers 8 --writers 2 --seconds 5
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlalchemy as sa  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from my_todo.db import create_engine  # noqa: E402
+
+SCHEMA = [
+    """
+    CREATE TABLE task (
+        id INTEGER NOT NULL PRIMARY KEY,
+        name VARCHAR NOT NULL,
+        notes VARCHAR NOT NULL,
+        status VARCHAR NOT NULL,
+        owner_id INTEGER
+    )
+    """,
+    "CREATE INDEX ix_task_owner_id ON task (owner_id)",
+]
+
+OWNERS = 100
+counts_lock = threading.Lock()
+
+
+def worker(engine, kind: str, stop: threading.Event, counts: dict, seed: int):
+    rng = random.Random(seed)
+    ops = errors = 0
+    while not stop.is_set():
+        owner = rng.randint(1, OWNERS)
+        try:
+            if kind == "reader":
+                with engine.connect() as conn:
+                    conn.execute(sa.text("SELECT * FROM task WHERE owner_id = :owner"), {"owner": owner}).fetchall()
+            else:
+                with engine.begin() as conn:
+                    conn.execute(
+                        sa.text("INSERT INTO task (name, notes, status, owner_id) VALUES ('t', 'n', 'Not Started', :owner)"),
+                        {"owner": owner},
+                    )
+                    conn.execute(
+                        sa.text("UPDATE task SET status = 'In Progress' WHERE owner_id = :owner AND id % 7 = 0"),
+                        {"owner": owner},
+                    )
+            ops += 1
+        except OperationalError:
+            errors += 1
+    with counts_lock:
+        counts[kind] = counts.get(kind, 0) + ops
+        counts["errors"] = counts.get("errors", 0) + errors
+
+
+def run(profile: str, readers: int, writers: int, seconds: float, rows: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", profile)
+        with engine.begin() as conn:
+            for statement in SCHEMA:
+                conn.execute(sa.text(statement))
+            conn.execute(
+                sa.text("INSERT INTO task (name, notes, status, owner_id) VALUES ('t', 'n', 'Not Started', :owner)"),
+                [{"owner": i % OWNERS + 1} for i in range(rows)],
+            )
+
+        stop = threading.Event()
+        counts: dict[str, int] = {}
+        threads = [
+            threading.Thread(target=worker, args=(engine, kind, stop, counts, i))
+            for i, kind in enumerate(["reader"] * readers + ["writer"] * writers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+
+    print(
+        f"{profile:<11} reads {counts.get('reader', 0) / seconds:9.1f}/s  "
+        f"writes {counts.get('writer', 0) / seconds:8.1f}/s  "
+        f"locked errors {counts.get('errors', 0)}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", default=["default", "production"])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+    for profile in args.profiles:
+        run(profile, args.readers, args.writers, args.seconds, args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark the backend cost of common dashboard events.
+
+Logs a manager with --tasks tasks in against a temporary database, then
+processes each event --repeat times through the state tree the way the
+websocket handler does. Reports the mean backend time per event (handler,
+delta and pickling the touched substates, as the disk and Redis state
+managers do), the size of the StateUpdate sent over the websocket and the
+bytes of state pickled.
+
+Usage:
+    python benchmarks/state_events.py --tasks 50 --repeat 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# (event handler, payload) pairs; typing events repeat with a growing value
+EVENTS = [
+    ("set_role_password", lambda i: {"password": "x" * (i % 20)}),
+    ("set_edit_name", lambda i: {"name": "Task " + "x" * (i % 20)}),
+    ("toggle_task_selected", lambda i: {"task_id": i % 5 + 1, "checked": i % 2 == 0}),
+    ("set_sort_by", lambda i: {"sort_by": ["date", "name"][i % 2]}),
+]
+
+
+def handler_class(root_cls, name: str):
+    """Return the state class defining an event handler, if any."""
+    pending = [root_cls]
+    while pending:
+        cls = pending.pop()
+        if name in vars(cls):
+            return cls
+        pending.extend(cls.class_subclasses)
+    return None
+
+
+def touched_bytes(state) -> int:
+    """Pickle the touched substates like a disk or Redis state manager does."""
+    size = 0
+    if state._get_was_touched():
+        state._was_touched = False
+        size += len(state._serialize())
+    for substate in state.substates.values():
+        size += touched_bytes(substate)
+    return size
+
+
+async def process(root, cls, name: str, payload: dict) -> tuple[float, int, int]:
+    from reflex.event import Event
+
+    event = Event(token="bench", name=f"{cls.get_full_name()}.{name}", payload=payload)
+    start = time.perf_counter()
+    sent = 0
+    async for update in root._process(event):
+        sent += len(update.json())
+    saved = touched_bytes(root)
+    return time.perf_counter() - start, sent, saved
+
+
+async def run(tasks: int, repeat: int):
+    import reflex as rx
+    import my_todo.my_todo as app_module
+    from my_todo.auth import hash_password
+    from my_todo.models import Task, TaskStatus, User
+
+    rx.Model.metadata.create_all(rx.model.get_engine())
+    with rx.session() as session:
+        session.add(User(
+            username="bench",
+            password=hash_password("pw", cost=(1024, 8, 1)),
+            role="Manager",
+            manager_password=hash_password("mpw", cost=(1024, 8, 1)),
+        ))
+        session.commit()
+        session.add_all(
+            Task(name=f"Task {i}", notes="Some notes", status=TaskStatus.NOT_STARTED, assigned_to="bench", owner_id=1)
+            for i in range(tasks)
+        )
+        session.commit()
+
+    root = rx.State(_reflex_internal_init=True)
+    login = handler_class(app_module.State, "login")
+    await process(root, login, "login", {"form_data": {"username": "bench", "password": "pw"}})
+
+    for name, payload in EVENTS:
+        cls = handler_class(app_module.State, name)
+        if cls is None:
+            print(f"{name:<22} (no such event handler)")
+            continue
+        total_time = total_sent = total_saved = 0
+        for i in range(repeat):
+            elapsed, sent, saved = await process(root, cls, name, payload(i))
+            total_time += elapsed
+            total_sent += sent
+            total_saved += saved
+        print(
+            f"{name:<22} {total_time / repeat * 1000:7.3f} ms/event  "
+            f"websocket {total_sent / repeat:8.0f} B  "
+            f"state saved {total_saved / repeat:8.0f} B"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # rxconfig.py uses a relative sqlite path, so run a copy inside the temp dir
+        with open(os.path.join(ROOT, "rxconfig.py")) as src, open(os.path.join(tmp, "rxconfig.py"), "w") as dst:
+            dst.write(src.read())
+        os.chdir(tmp)
+        asyncio.run(run(args.tasks, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
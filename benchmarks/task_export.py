@@ -0,0 +1,92 @@
+"""Benchmark streaming vs materialized task exports.
+
+Exports one user's --rows tasks as CSV twice: once by loading every Task row
+into a list first (as current_tasks does for a page) and once by streaming
+columns from a yield_per cursor through my_todo.export.iter_csv. Reports the
+time to the first chunk, the total time and the peak Python memory of each.
+
+Usage:
+    python benchmarks/task_export.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Reflex has to be imported before sqlmodel, so load the app module first.
+from my_todo.export import EXPORT_FIELDS, export_query, export_row, iter_csv  # noqa: E402
+from my_todo.db import create_engine  # noqa: E402
+
+import sqlalchemy as sa  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+from my_todo.models import Task  # noqa: E402
+
+
+def setup(path: str, rows: int):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.execute(sa.text(
+            "CREATE TABLE task (id INTEGER PRIMARY KEY, name VARCHAR, date DATE, legacy_date VARCHAR, "
+            "notes VARCHAR, status SMALLINT, assigned_to VARCHAR, assignee_id INTEGER, owner_id INTEGER)"
+        ))
+        conn.execute(sa.text("CREATE INDEX ix_task_owner_id_date ON task (owner_id, date)"))
+        conn.execute(
+            sa.text(
+                "INSERT INTO task (name, date, notes, status, assigned_to, owner_id) "
+                "VALUES (:name, :date, 'Some notes about the task', 1, 'member1', 1)"
+            ),
+            [{"name": f"Task {i}", "date": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}"} for i in range(rows)],
+        )
+    return engine
+
+
+def materialized(engine, chunk_size: int):
+    with Session(engine) as session:
+        tasks = session.exec(select(Task).where(Task.owner_id == 1).order_by(Task.date, Task.id)).all()
+        yield from iter_csv(export_row(getattr(task, field) for field in EXPORT_FIELDS) for task in tasks)
+
+
+def streamed(engine, chunk_size: int):
+    with Session(engine) as session:
+        rows = session.exec(export_query(1, []).execution_options(yield_per=chunk_size))
+        yield from iter_csv(export_row(row) for row in rows)
+
+
+def run(name: str, export, engine, chunk_size: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    for chunk in export(engine, chunk_size):
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<13} first chunk {first * 1000:9.1f} ms  total {elapsed:7.2f} s  "
+        f"peak memory {peak / 2**20:8.1f} MiB  ({size / 2**20:.1f} MiB written)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = setup(os.path.join(tmp, "bench.db"), args.rows)
+        run("materialized", materialized, engine, args.chunk_size)
+        run("streamed", streamed, engine, args.chunk_size)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark task queries with and without the task owner indexes.
+
+Usage:
+    python benchmarks/task_indexes.py --sizes 10000 100000 1000000
+"""
+import argparse
+import random
+import sqlite3
+import statistics
+import time
+
+STATUSES = ["Not Started", "In Progress", "Completed"]
+
+SCHEMA = """
+CREATE TABLE task (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    date VARCHAR NOT NULL,
+    notes VARCHAR NOT NULL,
+    status VARCHAR NOT NULL,
+    assigned_to VARCHAR NOT NULL,
+    owner_id INTEGER
+)
+"""
+
+INDEXES = [
+    "CREATE INDEX ix_task_owner_id ON task (owner_id)",
+    "CREATE INDEX ix_task_owner_id_status_date ON task (owner_id, status, date)",
+]
+
+QUERIES = {
+    "owner": (
+        "SELECT * FROM task WHERE owner_id = ?",
+        lambda owner: (owner,),
+    ),
+    "owner+status+date": (
+        "SELECT * FROM task WHERE owner_id = ? AND status = ? AND date BETWEEN ? AND ?",
+        lambda owner: (owner, "In Progress", "2025-01-01", "2025-03-31"),
+    ),
+}
+
+
+def populate(conn: sqlite3.Connection, n_tasks: int, n_owners: int, seed: int):
+    """Fill the task table with n_tasks rows spread over n_owners."""
+    rng = random.Random(seed)
+    rows = (
+        (
+            f"Task {i}",
+            f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "",
+            rng.choice(STATUSES),
+            f"user{rng.randint(1, n_owners)}",
+            rng.randint(1, n_owners),
+        )
+        for i in range(n_tasks)
+    )
+    conn.executemany(
+        "INSERT INTO task (name, date, notes, status, assigned_to, owner_id) VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+
+
+def time_query(conn: sqlite3.Connection, sql: str, params, owners: list[int]) -> float:
+    """Return the median latency of the query in milliseconds."""
+    samples = []
+    for owner in owners:
+        start = time.perf_counter()
+        conn.execute(sql, params(owner)).fetchall()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(n_tasks: int, n_owners: int, repeat: int, seed: int):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(SCHEMA)
+    populate(conn, n_tasks, n_owners, seed)
+    owners = random.Random(seed + 1).sample(range(1, n_owners + 1), min(repeat, n_owners))
+
+    results = {}
+    for label, (sql, params) in QUERIES.items():
+        results[label] = [time_query(conn, sql, params, owners)]
+    for statement in INDEXES:
+        conn.execute(statement)
+    conn.execute("ANALYZE")
+    for label, (sql, params) in QUERIES.items():
+        results[label].append(time_query(conn, sql, params, owners))
+    conn.close()
+
+    for label, (before, after) in results.items():
+        print(
+            f"{n_tasks:>9} tasks  {label:<18} "
+            f"no index {before:9.3f} ms  indexed {after:7.3f} ms  "
+            f"({before / after:6.1f}x)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--owners", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.owners, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark task search: LIKE scan, FTS5 over all tasks, FTS5 scoped to the user.
+
+Seeds a database per size with my_todo.seed, so the words, their frequencies
+and the skew of tasks per owner are those of the load test dataset, and times
+one owner's search for the first page of results:
+
+- LIKE: the scan search replaced, over the owner's tasks in date order
+- FTS all users: the index of revision 73cacacd87f9, matching the words in
+  every user's tasks and ranking them all before filtering by owner
+- FTS per user: the app's query, matching owner_id together with the words
+  (see my_todo.my_todo.fts_query); searches with a word shorter than
+  RANKED_WORD_LENGTH are listed newest first instead of ranked
+
+Queries are 1, 2 and 3 character prefixes, whole words and word pairs from
+the seed vocabulary, each by --repeat owners drawn by task count, as the busy
+owners search most. Prints the median and 95th percentile in milliseconds.
+
+Usage:
+    python benchmarks/task_search.py --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from my_todo.my_todo import RANKED_WORD_LENGTH, TASKS_PER_PAGE, fts_query  # noqa: E402
+from my_todo.seed import NOUNS, VERBS, WORDS, seed  # noqa: E402
+
+GLOBAL_FTS_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE task_fts_all USING fts5(
+        name, notes,
+        content='task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    "INSERT INTO task_fts_all(task_fts_all) VALUES ('rebuild')",
+]
+
+
+def like_sql(words: list[str]) -> str:
+    matches = " AND ".join("(name LIKE ? OR notes LIKE ?)" for _ in words)
+    return f"SELECT * FROM task WHERE owner_id = ? AND {matches} ORDER BY date, id LIMIT {TASKS_PER_PAGE + 1}"
+
+
+GLOBAL_FTS_SQL = f"""
+    SELECT task.* FROM task JOIN task_fts_all ON task_fts_all.rowid = task.id
+    WHERE task.owner_id = ? AND task_fts_all MATCH ?
+    ORDER BY bm25(task_fts_all), task.id LIMIT {TASKS_PER_PAGE + 1}
+"""
+
+RANKED_SQL = f"""
+    SELECT task.* FROM task JOIN task_fts ON task_fts.rowid = task.id
+    WHERE task.owner_id = ? AND task_fts MATCH ?
+    ORDER BY bm25(task_fts, 1.0, 1.0, 0.0, 0.0), task.id LIMIT {TASKS_PER_PAGE + 1}
+"""
+
+NEWEST_SQL = f"""
+    SELECT task.* FROM task JOIN task_fts ON task_fts.rowid = task.id
+    WHERE task.owner_id = ? AND task_fts MATCH ?
+    ORDER BY task_fts.rowid DESC LIMIT {TASKS_PER_PAGE + 1}
+"""
+
+
+def vocabulary() -> list[str]:
+    return sorted({word for text in VERBS + NOUNS + WORDS for word in re.findall(r"\w+", text.lower())})
+
+
+def queries(rng: random.Random, kind: str) -> list[str]:
+    """Return the words of one query of a kind."""
+    words = [word for word in vocabulary() if len(word) > 3]
+    if kind == "word pair":
+        return rng.sample(words, 2)
+    word = rng.choice(words)
+    return [word] if kind == "word" else [word[: int(kind[0])]]
+
+
+def ms(conn: sqlite3.Connection, sql: str, params: tuple) -> float:
+    start = time.perf_counter()
+    conn.execute(sql, params).fetchall()
+    return (time.perf_counter() - start) * 1000
+
+
+def summary(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1] if len(samples) > 1 else samples[0]
+    return f"{statistics.median(samples):7.2f} / {p95:7.2f}"
+
+
+def run(path: str, n_tasks: int, n_users: int, repeat: int, seed_value: int):
+    seed(path, n_users, n_tasks, seed=seed_value)
+    conn = sqlite3.connect(path)
+    for statement in GLOBAL_FTS_SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    owners = conn.execute("SELECT owner_id, count(*) FROM task GROUP BY owner_id").fetchall()
+
+    rng = random.Random(seed_value + 1)
+    print(f"{n_tasks} tasks, {len(owners)} owners, largest {max(count for _, count in owners)} tasks")
+    print(f"{'query':<12}{'LIKE scan':>18}{'FTS all users':>18}{'FTS per user':>18}   (p50 / p95 ms)")
+    for kind in ("1 char", "2 chars", "3 chars", "word", "word pair"):
+        like, global_fts, user_fts = [], [], []
+        for owner_id, _ in rng.choices(owners, [count for _, count in owners], k=repeat):
+            words = queries(rng, kind)
+            like.append(ms(conn, like_sql(words), (owner_id, *(f"%{word}%" for word in words for _ in "ab"))))
+            phrases = " ".join(f'"{word}"*' for word in words)
+            global_fts.append(ms(conn, GLOBAL_FTS_SQL, (owner_id, phrases)))
+            ranked = min(len(word) for word in words) >= RANKED_WORD_LENGTH
+            user_fts.append(ms(
+                conn, RANKED_SQL if ranked else NEWEST_SQL, (owner_id, fts_query(words, "owner_id", owner_id))
+            ))
+        print(f"{kind:<12}{summary(like):>18}{summary(global_fts):>18}{summary(user_fts):>18}")
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--users", type=int, default=1000, help="seeded users, a tenth of them owners")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            run(os.path.join(tmp, "search.db"), size, args.users, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Password hashing for user and manager passwords.
+
+Passwords are stored as ``scrypt$n$r$p$salt$hash``. Values without that prefix
+are legacy plaintext rows, which still verify and are rehashed on the next
+successful login.
+
+The scrypt cost can be tuned from ``rxconfig.py``::
+
+    config = rx.Config(
+        app_name="my_todo",
+        password_scrypt_n=2**14,
+        password_scrypt_r=8,
+        password_scrypt_p=1,
+        password_hash_workers=4,
+    )
+"""
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from reflex.config import get_config
+
+HASH_SCHEME = "scrypt"
+
+
+def _cost() -> tuple[int, int, int]:
+    """Return the configured scrypt (n, r, p) cost parameters."""
+    config = get_config()
+    return (
+        int(getattr(config, "password_scrypt_n", 2**14)),
+        int(getattr(config, "password_scrypt_r", 8)),
+        int(getattr(config, "password_scrypt_p", 1)),
+    )
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=256 * n * r + 2**20,
+        dklen=32,
+    )
+
+
+def is_hashed(stored: str) -> bool:
+    """Check whether a stored password is a hash rather than legacy plaintext."""
+    return stored.startswith(HASH_SCHEME + "$")
+
+
+def hash_password(
+    password: str,
+    cost: Optional[tuple[int, int, int]] = None,
+    salt: Optional[bytes] = None,
+) -> str:
+    """Hash a password with a random salt, or the given one for reproducible test data."""
+    n, r, p = cost or _cost()
+    salt = salt or secrets.token_bytes(16)
+    digest = _scrypt(password, salt, n, r, p)
+    return f"{HASH_SCHEME}${n}${r}${p}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, stored: str) -> bool:
+    """Check a password against a stored hash or legacy plaintext value."""
+    if not stored:
+        return False
+    if not is_hashed(stored):
+        return hmac.compare_digest(password.encode(), stored.encode())
+    try:
+        _, n, r, p, salt, digest = stored.split("$")
+        expected = bytes.fromhex(digest)
+        actual = _scrypt(password, bytes.fromhex(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
+
+
+def needs_rehash(stored: str) -> bool:
+    """Check whether a stored password is plaintext or uses an outdated cost."""
+    if not is_hashed(stored):
+        return True
+    n, r, p = stored.split("$")[1:4]
+    return (int(n), int(r), int(p)) != _cost()
+
+
+# Hashing is CPU bound; run it in a dedicated pool so it doesn't block the event loop.
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        workers = getattr(get_config(), "password_hash_workers", None) or min(4, os.cpu_count() or 1)
+        _executor = ThreadPoolExecutor(max_workers=int(workers), thread_name_prefix="password-hash")
+    return _executor
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), hash_password, password)
+
+
+async def verify_password_async(password: str, stored: str) -> bool:
+    """Verify a password in the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), verify_password, password, stored)
@@ -0,0 +1,146 @@
+"""Publish/subscribe bus for task changes.
+
+Event handlers publish a ``TaskChange`` after a task is added, edited or
+deleted, and every logged in session runs a background subscriber that
+applies the changes addressed to it. The bus is selected with ``task_bus`` in
+``rxconfig.py``:
+
+- ``"memory"`` (the default) delivers changes within one backend process.
+- ``"package.module:ClassName"`` loads another ``TaskBus`` implementation,
+  e.g. one backed by Redis pub/sub when running several workers. Changes
+  cross process boundaries as ``TaskChange.to_json()``.
+"""
+import abc
+import asyncio
+import contextlib
+import dataclasses
+import importlib
+import json
+from datetime import date
+from typing import Any, AsyncIterator, Optional
+
+from reflex.config import get_config
+
+from .models import Task, TaskStatus
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskChange:
+    """A task that was saved or deleted, or many tasks that were written at once."""
+
+    # "saved", "deleted", "batch" for the changes of one bulk action, or
+    # "reload" after a bulk write such as an import
+    kind: str
+    # None for batches and reloads
+    task_id: Optional[int]
+    owner_id: Optional[int]
+    assignee_id: Optional[int]
+    # The task's column values, None for deletes
+    task: Optional[dict[str, Any]] = None
+    # The saved and deleted changes of a batch
+    changes: tuple["TaskChange", ...] = ()
+
+    @classmethod
+    def saved(cls, task: Task) -> "TaskChange":
+        """Describe a task that was added or edited."""
+        values = {column.name: getattr(task, column.name) for column in Task.__table__.columns}
+        return cls("saved", task.id, task.owner_id, task.assignee_id, values)
+
+    @classmethod
+    def deleted(cls, task: Task) -> "TaskChange":
+        """Describe a task that was deleted."""
+        return cls("deleted", task.id, task.owner_id, task.assignee_id)
+
+    @classmethod
+    def reload(cls, owner_id: int, assignee_id: Optional[int] = None) -> "TaskChange":
+        """Ask the sessions of an owner, or of an assignee, to reload their tasks."""
+        return cls("reload", None, owner_id, assignee_id)
+
+    @classmethod
+    def batch(cls, changes: list["TaskChange"]) -> "TaskChange":
+        """Group the changes of one bulk action, so subscribers apply them at once."""
+        return cls("batch", None, None, None, changes=tuple(changes))
+
+    def addressed_to(self, user_id: int) -> list["TaskChange"]:
+        """Return the changes, of a batch or just this one, that concern a user's tasks."""
+        changes = self.changes if self.kind == "batch" else (self,)
+        return [change for change in changes if user_id in (change.owner_id, change.assignee_id)]
+
+    def to_json(self) -> str:
+        """Encode the change for buses that cross process boundaries."""
+        return json.dumps(dataclasses.asdict(self), default=str)
+
+    @classmethod
+    def from_json(cls, data: str) -> "TaskChange":
+        """Decode a change encoded with to_json."""
+        return cls._from_values(json.loads(data))
+
+    @classmethod
+    def _from_values(cls, values: dict[str, Any]) -> "TaskChange":
+        task = values.get("task")
+        if task:
+            task["status"] = TaskStatus(task["status"])
+            if task.get("date"):
+                task["date"] = date.fromisoformat(task["date"])
+        values["changes"] = tuple(cls._from_values(change) for change in values.get("changes", ()))
+        return cls(**values)
+
+
+class TaskBus(abc.ABC):
+    """Interface of a task change bus."""
+
+    @abc.abstractmethod
+    async def publish(self, change: TaskChange):
+        """Deliver a change to all current subscribers."""
+
+    @abc.abstractmethod
+    def subscribe(self) -> contextlib.AbstractAsyncContextManager["asyncio.Queue[TaskChange]"]:
+        """Return a context manager yielding a queue that receives published changes."""
+
+
+class InProcessBus(TaskBus):
+    """Deliver changes to the subscribers of this process through asyncio queues."""
+
+    def __init__(self, max_pending: int = 1000):
+        self.max_pending = max_pending
+        self._queues: set[asyncio.Queue] = set()
+
+    async def publish(self, change: TaskChange):
+        for queue in list(self._queues):
+            try:
+                queue.put_nowait(change)
+            except asyncio.QueueFull:
+                # A stalled subscriber loses changes rather than holding up the publisher
+                pass
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self) -> AsyncIterator["asyncio.Queue[TaskChange]"]:
+        queue: asyncio.Queue = asyncio.Queue(self.max_pending)
+        self._queues.add(queue)
+        try:
+            yield queue
+        finally:
+            self._queues.discard(queue)
+
+
+BUSES: dict[str, type[TaskBus]] = {
+    "memory": InProcessBus,
+}
+
+_bus: Optional[TaskBus] = None
+
+
+def get_bus() -> TaskBus:
+    """Return the configured task bus, creating it on first use."""
+    global _bus
+    if _bus is None:
+        name = getattr(get_config(), "task_bus", "memory")
+        if name in BUSES:
+            bus_class = BUSES[name]
+        elif ":" in name:
+            module, _, attr = name.partition(":")
+            bus_class = getattr(importlib.import_module(module), attr)
+        else:
+            raise ValueError(f"Unknown task_bus {name!r}, expected one of {sorted(BUSES)} or 'module:Class'")
+        _bus = bus_class()
+    return _bus
@@ -0,0 +1,140 @@
+"""Per-user task counters behind the dashboard summary.
+
+Each user has a ``task_counts`` row with their number of tasks per status,
+overdue tasks and tasks due tomorrow, so the summary is one primary key lookup
+however many tasks there are. Handlers that add, edit or delete tasks
+call ``update_counts`` in the same transaction as the task write. As with the
+task countdown, which runs to the start of the due date, an open task is
+overdue from its due date on.
+
+Overdue and due soon depend on the day, so each row records the day it was
+counted on (``as_of``). A row counted on an earlier day, or missing, is
+recounted from ``task`` on its next update or read, and ``reconcile_task_counts``
+recounts every user each ``task_counts_reconcile_interval`` seconds to repair
+any drift. A recount is a single INSERT ... SELECT, so it reads ``task`` while
+holding SQLite's write lock and cannot overwrite a task write committed during
+the count.
+"""
+import asyncio
+from collections import Counter
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+import reflex as rx
+from reflex.config import get_config
+from sqlalchemy import Date, case, func, insert, literal, update
+from sqlmodel import select
+
+from .models import Task, TaskCounts, TaskStatus, User
+
+# The counter of each status
+STATUS_COUNTERS = {
+    TaskStatus.NOT_STARTED: "not_started",
+    TaskStatus.IN_PROGRESS: "in_progress",
+    TaskStatus.COMPLETED: "completed",
+}
+COUNTERS = (*STATUS_COUNTERS.values(), "overdue", "due_soon")
+
+
+def reconcile_interval() -> int:
+    """Return the seconds between full recounts (``task_counts_reconcile_interval`` in rx.Config)."""
+    return int(getattr(get_config(), "task_counts_reconcile_interval", 3600))
+
+
+def task_counters(status: TaskStatus, due: Optional[date], today: date) -> list[str]:
+    """Return the counters a task with this status and due date adds to."""
+    counters = [STATUS_COUNTERS[status]]
+    if status != TaskStatus.COMPLETED and due is not None:
+        if due <= today:
+            counters.append("overdue")
+        elif due == today + timedelta(days=1):
+            counters.append("due_soon")
+    return counters
+
+
+async def update_counts(
+    session,
+    user_id: Optional[int],
+    added: Iterable[tuple[TaskStatus, Optional[date]]] = (),
+    removed: Iterable[tuple[TaskStatus, Optional[date]]] = (),
+):
+    """Adjust a user's counters for tasks added and removed, given as (status, date) pairs.
+
+    Runs in the caller's transaction; an edit removes the old values and adds
+    the new ones.
+    """
+    if user_id is None:
+        return
+    today = date.today()
+    deltas: Counter[str] = Counter()
+    for status, due in added:
+        deltas.update(task_counters(status, due, today))
+    for status, due in removed:
+        deltas.subtract(task_counters(status, due, today))
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    result = await session.exec(
+        update(TaskCounts)
+        .where(TaskCounts.user_id == user_id, TaskCounts.as_of == today)
+        .values({name: getattr(TaskCounts, name) + delta for name, delta in deltas.items()})
+    )
+    if result.rowcount == 0:
+        # Missing or counted on an earlier day; recount including the caller's pending writes
+        await session.flush()
+        await reconcile_counts(session, [user_id])
+
+
+def counts_query(today: date, user_ids: Optional[list[int]] = None):
+    """Select the counters of each task owner from the task table."""
+    is_open = Task.status != TaskStatus.COMPLETED
+    query = select(
+        Task.owner_id,
+        *(
+            func.sum(case((Task.status == status, 1), else_=0)).label(name)
+            for status, name in STATUS_COUNTERS.items()
+        ),
+        func.sum(case((is_open & (Task.date <= today), 1), else_=0)).label("overdue"),
+        func.sum(case((is_open & (Task.date == today + timedelta(days=1)), 1), else_=0)).label("due_soon"),
+    ).group_by(Task.owner_id)
+    if user_ids is not None:
+        query = query.where(Task.owner_id.in_(user_ids))
+    return query
+
+
+async def reconcile_counts(session, user_ids: Optional[list[int]] = None):
+    """Recount the counters of some users, or of every user, in the caller's transaction."""
+    today = date.today()
+    counted = counts_query(today, user_ids).subquery()
+    users = select(
+        User.id,
+        literal(today, Date),
+        *(func.coalesce(counted.c[name], 0) for name in COUNTERS),
+    ).outerjoin(counted, counted.c.owner_id == User.id)
+    if user_ids is not None:
+        users = users.where(User.id.in_(user_ids))
+    await session.exec(
+        insert(TaskCounts).prefix_with("OR REPLACE").from_select(["user_id", "as_of", *COUNTERS], users)
+    )
+
+
+async def get_counts(session, user_id: int) -> TaskCounts:
+    """Return a user's counters, recounting and committing them first if they are stale."""
+    counts = await session.get(TaskCounts, user_id)
+    if counts is None or counts.as_of != date.today():
+        await reconcile_counts(session, [user_id])
+        await session.commit()
+        counts = await session.get(TaskCounts, user_id, populate_existing=True)
+    return counts
+
+
+async def reconcile_task_counts():
+    """Recount every user's counters now and then every reconcile_interval seconds (app lifespan task)."""
+    while True:
+        try:
+            async with rx.asession() as session:
+                await reconcile_counts(session)
+                await session.commit()
+        except Exception as e:
+            print(f"Error reconciling task counts: {str(e)}")
+        await asyncio.sleep(reconcile_interval())
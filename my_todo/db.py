@@ -0,0 +1,114 @@
+"""Database engine profiles.
+
+The profile is selected with ``db_profile`` in ``rxconfig.py``:
+
+- ``"default"`` leaves Reflex's engine settings untouched.
+- ``"production"`` turns on WAL mode and tuned pragmas for every SQLite
+  connection, and sizes the connection pool. This applies to both the
+  ``db_url`` engine and the ``async_db_url`` engine used by ``rx.asession()``.
+
+Individual settings can be overridden with ``db_pool_size``,
+``db_max_overflow``, ``db_busy_timeout`` (ms), ``db_mmap_size`` (bytes) and
+``db_cache_size`` (KiB) in the same config.
+"""
+from typing import Any
+
+import reflex as rx
+import sqlalchemy
+import sqlalchemy.ext.asyncio
+import sqlmodel
+from reflex.config import get_config
+
+PROFILES: dict[str, dict[str, Any]] = {
+    "default": {},
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": 64 * 1024,
+        "pool_size": 10,
+        "max_overflow": 20,
+    },
+}
+
+
+def profile_settings(name: str) -> dict[str, Any]:
+    """Return the settings of a profile with any rx.Config overrides applied."""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown db_profile {name!r}, expected one of {sorted(PROFILES)}")
+    settings = dict(PROFILES[name])
+    config = get_config()
+    for key in ("pool_size", "max_overflow", "busy_timeout", "mmap_size", "cache_size"):
+        value = getattr(config, f"db_{key}", None)
+        if value is not None:
+            settings[key] = value
+    return settings
+
+
+def sqlite_pragmas(settings: dict[str, Any]) -> list[str]:
+    """Return the PRAGMA statements to run on each new SQLite connection."""
+    pragmas = []
+    if "journal_mode" in settings:
+        pragmas.append(f"PRAGMA journal_mode={settings['journal_mode']}")
+    if "synchronous" in settings:
+        pragmas.append(f"PRAGMA synchronous={settings['synchronous']}")
+    if "busy_timeout" in settings:
+        pragmas.append(f"PRAGMA busy_timeout={int(settings['busy_timeout'])}")
+    if "mmap_size" in settings:
+        pragmas.append(f"PRAGMA mmap_size={int(settings['mmap_size'])}")
+    if "cache_size" in settings:
+        # Negative values are in KiB rather than pages
+        pragmas.append(f"PRAGMA cache_size={-int(settings['cache_size'])}")
+    return pragmas
+
+
+def apply_profile(engine: sqlalchemy.engine.Engine, settings: dict[str, Any]):
+    """Run the profile's pragmas on every connection the engine opens."""
+    pragmas = sqlite_pragmas(settings)
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _engine_args(url: str, settings: dict[str, Any]) -> dict[str, Any]:
+    kwargs = rx.model.get_engine_args(url)
+    for key in ("pool_size", "max_overflow"):
+        if key in settings:
+            kwargs[key] = settings[key]
+    return kwargs
+
+
+def create_engine(url: str, profile: str = "default") -> sqlalchemy.engine.Engine:
+    """Create an engine for the url using a profile's pool size and pragmas."""
+    settings = profile_settings(profile)
+    engine = sqlmodel.create_engine(url, **_engine_args(url, settings))
+    apply_profile(engine, settings)
+    return engine
+
+
+def create_async_engine(url: str, profile: str = "default") -> sqlalchemy.ext.asyncio.AsyncEngine:
+    """Create an async engine for the url using a profile's pool size and pragmas."""
+    settings = profile_settings(profile)
+    engine = sqlalchemy.ext.asyncio.create_async_engine(url, **_engine_args(url, settings))
+    apply_profile(engine.sync_engine, settings)
+    return engine
+
+
+def configure_database():
+    """Install the engines for the configured db_profile before first use."""
+    config = get_config()
+    profile = getattr(config, "db_profile", "default")
+    if profile == "default":
+        return
+    # Reflex caches engines by url, so rx.session() and rx.asession() pick these up.
+    if config.db_url and config.db_url not in rx.model._ENGINE:
+        rx.model._ENGINE[config.db_url] = create_engine(config.db_url, profile)
+    if config.async_db_url and config.async_db_url not in rx.model._ASYNC_ENGINE:
+        rx.model._ASYNC_ENGINE[config.async_db_url] = create_async_engine(config.async_db_url, profile)
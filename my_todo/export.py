@@ -0,0 +1,201 @@
+"""Streaming CSV and JSON export of a user's tasks.
+
+The dashboard asks for an export with ``create_export``, which returns a
+short-lived token carrying the user, filters and expiry, signed with HMAC. The
+browser then downloads ``/export/{token}.csv`` or ``/export/{token}.json``
+from the backend, and the rows are streamed from a server-side cursor
+``export_chunk_size`` rows at a time, so memory use does not grow with the
+number of tasks.
+
+Tokens are checked against the signature alone, so any worker can serve the
+download. Every worker must then share ``export_secret`` in rx.Config; without
+it each process signs with its own random key and links only work on the
+worker that made them.
+"""
+import base64
+import binascii
+import csv
+import hashlib
+import hmac
+import io
+import json
+import secrets
+import time
+from datetime import date
+from typing import Any, Iterator, Optional
+
+import reflex as rx
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from reflex.config import get_config
+from sqlmodel import select
+
+from .models import Task, parse_status
+
+EXPORT_FIELDS = ("id", "name", "date", "notes", "status", "assigned_to")
+EXPORT_FORMATS = {"csv": "text/csv", "json": "application/json"}
+
+# Characters of encoded output buffered before a chunk is sent
+FLUSH_SIZE = 64 * 1024
+
+# Seconds an export link stays valid
+EXPORT_TOKEN_TTL = 300
+
+# Signing key when export_secret is not configured
+_fallback_secret = secrets.token_bytes(32)
+
+
+def export_secret() -> bytes:
+    """Return the key export tokens are signed with (``export_secret`` in rx.Config)."""
+    secret = getattr(get_config(), "export_secret", None)
+    return secret.encode() if secret else _fallback_secret
+
+
+def _sign(payload: bytes) -> str:
+    digest = hmac.new(export_secret(), payload, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def export_chunk_size() -> int:
+    """Return the number of rows fetched per cursor round trip (``export_chunk_size`` in rx.Config)."""
+    return int(getattr(get_config(), "export_chunk_size", 1000))
+
+
+def create_export(
+    owner_id: int,
+    statuses: list[str],
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> str:
+    """Return a signed token for an export of a user's tasks, valid for EXPORT_TOKEN_TTL seconds."""
+    payload = json.dumps(
+        {
+            "owner_id": owner_id,
+            "statuses": list(statuses),
+            "date_from": date_from.isoformat() if date_from else None,
+            "date_to": date_to.isoformat() if date_to else None,
+            "expires": int(time.time()) + EXPORT_TOKEN_TTL,
+        },
+        separators=(",", ":"),
+    ).encode()
+    return f"{base64.urlsafe_b64encode(payload).rstrip(b'=').decode()}.{_sign(payload)}"
+
+
+def read_export(token: str) -> Optional[dict[str, Any]]:
+    """Return the export parameters of a token, or None if it is forged, malformed or expired."""
+    encoded, _, signature = token.partition(".")
+    try:
+        payload = _b64decode(encoded)
+    except (binascii.Error, ValueError):
+        return None
+    # Compared as bytes: compare_digest rejects str with non-ASCII characters
+    if not hmac.compare_digest(signature.encode(), _sign(payload).encode()):
+        return None
+    try:
+        values = json.loads(payload)
+        if values["expires"] < time.time():
+            return None
+        return {
+            "owner_id": int(values["owner_id"]),
+            "statuses": [str(status) for status in values["statuses"]],
+            "date_from": date.fromisoformat(values["date_from"]) if values["date_from"] else None,
+            "date_to": date.fromisoformat(values["date_to"]) if values["date_to"] else None,
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def export_url(token: str, fmt: str) -> str:
+    """Return the backend url an export is downloaded from."""
+    return f"{get_config().api_url}/export/{token}.{fmt}"
+
+
+def export_query(
+    owner_id: int,
+    statuses: list[str],
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+):
+    """Select the exported columns of a user's tasks in date order."""
+    query = select(*(getattr(Task, field) for field in EXPORT_FIELDS)).where(Task.owner_id == owner_id)
+    if statuses:
+        query = query.where(Task.status.in_([parse_status(status) for status in statuses]))
+    if date_from:
+        query = query.where(Task.date >= date_from)
+    if date_to:
+        query = query.where(Task.date <= date_to)
+    return query.order_by(Task.date, Task.id)
+
+
+def export_row(row) -> dict[str, Any]:
+    """Map a row of export_query to a dict, with the status as its label."""
+    task = dict(zip(EXPORT_FIELDS, row))
+    task["status"] = task["status"].label
+    return task
+
+
+def iter_tasks(params: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield the exported tasks as dicts, reading the cursor in chunks."""
+    with rx.session() as session:
+        rows = session.exec(
+            export_query(**params).execution_options(yield_per=export_chunk_size())
+        )
+        for row in rows:
+            yield export_row(row)
+
+
+def iter_csv(tasks: Iterator[dict[str, Any]]) -> Iterator[str]:
+    """Encode tasks as CSV in chunks of about FLUSH_SIZE characters."""
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    for task in tasks:
+        writer.writerow(task)
+        if out.tell() >= FLUSH_SIZE:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    yield out.getvalue()
+
+
+def iter_json(tasks: Iterator[dict[str, Any]]) -> Iterator[str]:
+    """Encode tasks as a JSON list in chunks of about FLUSH_SIZE characters."""
+    chunk = ["["]
+    size = 0
+    separator = "\n"
+    for task in tasks:
+        line = separator + json.dumps(task, default=str)
+        chunk.append(line)
+        size += len(line)
+        separator = ",\n"
+        if size >= FLUSH_SIZE:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    chunk.append("\n]\n")
+    yield "".join(chunk)
+
+
+def download_export(token: str, fmt: str) -> StreamingResponse:
+    """Stream the export a token describes (GET /export/{token}.{fmt})."""
+    params = read_export(token)
+    if params is None:
+        raise HTTPException(status_code=404, detail="Export link expired")
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=404, detail=f"Unsupported export format {fmt!r}")
+    encode = iter_csv if fmt == "csv" else iter_json
+    # A sync iterator is consumed in Starlette's thread pool, off the event loop
+    return StreamingResponse(
+        encode(iter_tasks(params)),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{fmt}"'},
+    )
+
+
+def register_export_routes(app: rx.App):
+    """Add the export download route to the app's backend."""
+    app.api.add_api_route("/export/{token}.{fmt}", download_export, methods=["GET"])
@@ -0,0 +1,100 @@
+"""Bulk task import from CSV, JSON and JSON Lines files.
+
+CSV files need a header row. JSON files hold a list of objects, JSON Lines
+files one object per line. Recognised fields are ``name``, ``date``
+(YYYY-MM-DD), ``notes``, ``status`` and ``assigned_to``. CSV and JSON Lines
+files are read one row at a time.
+
+Uploads wait for their import in a private temporary directory, ``import_dir``,
+rather than the upload directory, which the backend serves at ``/_upload``.
+"""
+import atexit
+import csv
+import json
+import shutil
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from reflex.config import get_config
+
+from .models import STATUSES, TaskStatus, parse_status
+
+IMPORT_FIELDS = ("name", "date", "notes", "status", "assigned_to")
+
+
+def import_batch_size() -> int:
+    """Return the number of rows inserted per transaction (``import_batch_size`` in rx.Config)."""
+    return int(getattr(get_config(), "import_batch_size", 1000))
+
+
+# This process's directory for uploaded import files, created on first use
+_import_dir: Optional[Path] = None
+
+
+def import_dir() -> Path:
+    """Return the private directory uploaded import files are kept in until imported."""
+    global _import_dir
+    if _import_dir is None:
+        # mkdtemp makes the directory readable by this user only
+        _import_dir = Path(tempfile.mkdtemp(prefix="my_todo-import-"))
+        atexit.register(shutil.rmtree, _import_dir, ignore_errors=True)
+    return _import_dir
+
+
+def remove_import_file(path: Path):
+    """Delete an uploaded import file; paths outside import_dir are left alone."""
+    if path.resolve().parent == import_dir().resolve():
+        path.unlink(missing_ok=True)
+
+
+class RowError(ValueError):
+    """A row that cannot be imported."""
+
+
+def iter_rows(path: Path) -> Iterator[tuple[int, Any]]:
+    """Yield (row number, raw row) pairs from an import file."""
+    suffix = path.suffix.lower()
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        if suffix == ".csv":
+            # Row 1 is the header
+            for number, row in enumerate(csv.DictReader(f), start=2):
+                yield number, row
+        elif suffix == ".jsonl":
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield number, RowError(f"Invalid JSON: {e.msg}")
+        elif suffix == ".json":
+            rows = json.load(f)
+            if not isinstance(rows, list):
+                raise RowError("JSON file must contain a list of tasks")
+            yield from enumerate(rows, start=1)
+        else:
+            raise RowError(f"Unsupported file type {suffix!r}, expected .csv, .json or .jsonl")
+
+
+def validate_row(row: Any) -> dict[str, Any]:
+    """Return the task column values for a raw row, or raise RowError."""
+    if isinstance(row, RowError):
+        raise row
+    if not isinstance(row, dict):
+        raise RowError("Row is not an object")
+    values = {field: str(row.get(field) or "").strip() for field in IMPORT_FIELDS}
+    if not values["name"]:
+        raise RowError("Missing name")
+    if not values["assigned_to"]:
+        raise RowError("Missing assigned_to")
+    try:
+        values["date"] = date.fromisoformat(values["date"])
+    except ValueError:
+        raise RowError(f"Invalid date {values['date']!r}, expected YYYY-MM-DD")
+    status = parse_status(values["status"]) if values["status"] else TaskStatus.NOT_STARTED
+    if status is None:
+        raise RowError(f"Invalid status {values['status']!r}, expected one of {STATUSES}")
+    values["status"] = status
+    return values
@@ -1,5 +1,48 @@
+from pydantic import ConfigDict
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional, List
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, SmallInteger, TypeDecorator
+from typing import Any, Optional, List
+import datetime
+import enum
+
+class TaskStatus(enum.IntEnum):
+    """Task status, stored in task.status as a small integer."""
+    NOT_STARTED = 1
+    IN_PROGRESS = 2
+    COMPLETED = 3
+
+    @property
+    def label(self) -> str:
+        return STATUS_LABELS[self]
+
+# Display labels, also seeded into the task_status lookup table
+STATUS_LABELS = {
+    TaskStatus.NOT_STARTED: "Not Started",
+    TaskStatus.IN_PROGRESS: "In Progress",
+    TaskStatus.COMPLETED: "Completed",
+}
+STATUSES = list(STATUS_LABELS.values())
+
+def parse_status(value: Any) -> Optional[TaskStatus]:
+    """Return the status named by a label or number, or None."""
+    for status, label in STATUS_LABELS.items():
+        if value == label:
+            return status
+    try:
+        return TaskStatus(int(value))
+    except (TypeError, ValueError):
+        return None
+
+class StatusType(TypeDecorator):
+    """Stores a TaskStatus as its small integer value."""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else TaskStatus(value)
 
 # Base class for SQLAlchemy models
 class ModelBase(SQLModel):
@@ -13,15 +56,76 @@ class User(SQLModel, table=True):
     password: str
     role: str
     manager_password: str
-    tasks: List["Task"] = Relationship(back_populates="owner")
+    tasks: List["Task"] = Relationship(
+        back_populates="owner",
+        sa_relationship_kwargs={"foreign_keys": "[Task.owner_id]"},
+    )
+
+class UserView(SQLModel):
+    """The logged in user as held in client state, without credentials."""
+    id: int
+    username: str
+    role: str
+
+    @classmethod
+    def from_user(cls, user: User, role: Optional[str] = None) -> "UserView":
+        """Copy the public fields of a user row, optionally with another role."""
+        return cls(id=user.id, username=user.username, role=role or user.role)
+
+    def with_role(self, role: str) -> "UserView":
+        """Return a copy of the view with another role."""
+        return UserView(id=self.id, username=self.username, role=role)
+
+    if hasattr(SQLModel, "model_config"):
+        model_config = ConfigDict(frozen=True)
+    else:
+        # Under Reflex, SQLModel runs on pydantic.v1, which only reads class-based config
+        class Config:
+            frozen = True
+
+class TaskStatusLabel(SQLModel, table=True):
+    """Lookup table naming each TaskStatus value, for reports and joins."""
+    __tablename__ = "task_status"
+
+    id: int = Field(sa_column=Column(SmallInteger, primary_key=True, autoincrement=False))
+    label: str = Field(unique=True)
 
 class Task(SQLModel, table=True):
     """Task model for todo items."""
+    __table_args__ = (
+        Index("ix_task_owner_id_status_date", "owner_id", "status", "date"),
+        Index("ix_task_owner_id_date", "owner_id", "date"),
+        Index("ix_task_assignee_id_date", "assignee_id", "date"),
+        CheckConstraint("status IN (1, 2, 3)", name="ck_task_status"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
-    date: str
+    date: Optional[datetime.date] = None
+    legacy_date: Optional[str] = None  # Unparsable date kept by the date migration
     notes: str
-    status: str
+    status: TaskStatus = Field(
+        default=TaskStatus.NOT_STARTED,
+        sa_column=Column(StatusType(), ForeignKey("task_status.id"), nullable=False),
+    )
     assigned_to: str
-    owner_id: Optional[int] = Field(default=None, foreign_key="user.id")
-    owner: Optional[User] = Relationship(back_populates="tasks")
\ No newline at end of file
+    # The user named by assigned_to, if there is one
+    assignee_id: Optional[int] = Field(default=None, foreign_key="user.id")
+    owner_id: Optional[int] = Field(default=None, foreign_key="user.id", index=True)
+    owner: Optional[User] = Relationship(
+        back_populates="tasks",
+        sa_relationship_kwargs={"foreign_keys": "[Task.owner_id]"},
+    )
+class TaskCounts(SQLModel, table=True):
+    """A user's task totals for the dashboard summary, kept by my_todo.counters."""
+    __tablename__ = "task_counts"
+
+    user_id: int = Field(primary_key=True, foreign_key="user.id")
+    # The day overdue and due_soon were counted on
+    as_of: datetime.date
+    not_started: int = 0
+    in_progress: int = 0
+    completed: int = 0
+    # Open tasks due on or before as_of, and due the day after
+    overdue: int = 0
+    due_soon: int = 0
@@ -1,7 +1,22 @@
+import asyncio
+import csv
+import io
+import re
+import uuid
 import reflex as rx
-from typing import Optional
-from sqlmodel import select
-from .models import User, Task
+from reflex.config import get_config
+from pathlib import Path
+from typing import Any, Optional
+from datetime import date
+from sqlalchemy import column, delete, func, insert, literal_column, table, update
+from sqlmodel import select, and_, or_
+from .bus import TaskChange, get_bus
+from .counters import STATUS_COUNTERS, get_counts, reconcile_task_counts, update_counts
+from .db import configure_database
+from .export import create_export, export_url, register_export_routes
+from .auth import hash_password, hash_password_async, needs_rehash, verify_password_async
+from .importer import RowError, import_batch_size, import_dir, iter_rows, remove_import_file, validate_row
+from .models import STATUSES, TaskCounts, TaskStatus, User, UserView, Task, parse_status
 
 class Task(rx.Base):
     name: str
@@ -28,92 +43,267 @@ import reflex as rx
 from typing import Optional
 from .models import User, Task
 
+# Countdown to a due date, rendered and ticked in the browser
+class TaskCountdown(rx.Component):
+    """Shows the time left until a task's due date as "Xd Yh Zm"."""
+
+    tag = "TaskCountdown"
+
+    # The due date as YYYY-MM-DD; the countdown runs to local midnight.
+    due: rx.Var[str]
+
+    # How often to refresh the label, in milliseconds.
+    interval: rx.Var[int]
+
+    def add_imports(self):
+        return {"react": ["useEffect", "useState"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [
+            """
+const TaskCountdown = ({ due, interval = 60000 }) => {
+  const [now, setNow] = useState(() => Date.now());
+  useEffect(() => {
+    const timer = setInterval(() => setNow(Date.now()), interval);
+    return () => clearInterval(timer);
+  }, [interval]);
+
+  const [year, month, day] = (due || "").split("-").map(Number);
+  const dueTime = new Date(year, month - 1, day).getTime();
+  let label = "Invalid date";
+  let color = "gray";
+  if (!Number.isNaN(dueTime)) {
+    const totalMinutes = Math.trunc((dueTime - now) / 60000);
+    if (totalMinutes <= 0) {
+      [label, color] = ["Due", "red"];
+    } else if (totalMinutes < 1440) {
+      label = `${Math.floor(totalMinutes / 60)}h ${totalMinutes % 60}m`;
+      color = "red";
+    } else {
+      const minutes = totalMinutes % 1440;
+      label = `${Math.floor(totalMinutes / 1440)}d ${Math.floor(minutes / 60)}h ${minutes % 60}m`;
+      color = "default";
+    }
+  }
+  return (
+    <span style={{ color: color === "default" ? undefined : `var(--${color}-11)`, fontWeight: "bold" }}>
+      {label}
+    </span>
+  );
+};
+"""
+        ]
+
+countdown_component = TaskCountdown.create
+
+# Number of task rows queried and mounted per page
+TASKS_PER_PAGE = 50
+
+# Columns the task table can be sorted by, always followed by id
+SORT_COLUMNS = {
+    "date": Task.date,
+    "status": Task.status,
+    "name": Task.name,
+}
+
+def task_sort_key(task: Task, sort_by: str = "date") -> tuple:
+    """Sort key matching the SQL order of tasks (NULLs first, then value, id)."""
+    value = getattr(task, sort_by)
+    return (value is not None, value if value is not None else "", task.id)
+
+def after_cursor(column, cursor: tuple[Any, int]):
+    """Keyset predicate selecting the tasks after (value, id) in page order."""
+    cursor_value, cursor_id = cursor
+    if cursor_value is None:
+        return or_(
+            and_(column.is_(None), Task.id > cursor_id),
+            column.is_not(None),
+        )
+    return or_(
+        column > cursor_value,
+        and_(column == cursor_value, Task.id > cursor_id),
+    )
+
+# FTS5 index over task name and notes, with owner_id and assignee_id as
+# tokens, see alembic revisions 73cacacd87f9 and 02f8976793b4
+task_fts = table("task_fts", column("rowid"))
+task_fts_column = literal_column("task_fts")  # The table-named column used by MATCH and bm25()
+
+# Searches with a shorter word are listed newest first instead of by rank;
+# such prefixes match too many tasks to rank on every keystroke.
+RANKED_WORD_LENGTH = 3
+
+def search_words(text: str) -> list[str]:
+    """Split a search box value into lowercase words."""
+    return re.findall(r"\w+", text.lower())
+
+def fts_query(words: list[str], user_column: str, user_id: int) -> str:
+    """Build an FTS5 query matching all words as prefixes in the tasks of one owner or assignee."""
+    phrases = " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+    return f'{user_column} : "{user_id}" AND {{name notes}} : ({phrases})'
+
+# (client token, user id) of the sessions running watch_task_changes in this
+# process. Keyed by user too, so logging in as someone else in the same tab
+# starts a new watcher while the old one is still waiting to notice the logout.
+_task_watchers: set[tuple[str, int]] = set()
+
+# Seconds between checks that a watching session is still connected
+WATCH_CHECK_INTERVAL = 30
+
+def session_connected(token: str) -> bool:
+    """Check whether a client's websocket is connected to this process."""
+    namespace = app.event_namespace
+    return namespace is None or token in namespace.token_to_sid
+
+async def find_user_ids(session, usernames) -> dict[str, int]:
+    """Map the given usernames that belong to users to their user ids."""
+    usernames = {name for name in usernames if name}
+    if not usernames:
+        return {}
+    rows = await session.exec(select(User.username, User.id).where(User.username.in_(usernames)))
+    return dict(rows.all())
+
+def optimistic_updates() -> bool:
+    """Whether edits and deletes show before they commit (``optimistic_updates`` in rx.Config)."""
+    return bool(getattr(get_config(), "optimistic_updates", True))
+
+def parse_date(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD date from a form field."""
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
 class State(rx.State):
     """The app state."""
-    
-    # Auth state
+
+
+class AuthState(State):
+    """The logged in user and the login and signup forms."""
+
     is_authenticated: bool = False
-    current_user: Optional[User] = None
+    current_user: Optional[UserView] = None
     error_message: str = ""
-    
+
     # View state
     show_signup: bool = False
     signup_error: str = ""
-    
-    # Modal state
-    show_role_modal: bool = False
-    role_password: str = ""
-    role_modal_error: str = ""
-    selected_role: str = ""
-    
-    # Edit modal state
-    show_edit_modal: bool = False
-    editing_task: Optional[Task] = None
-    edit_name: str = ""
-    edit_date: str = ""
-    edit_notes: str = ""
-    edit_status: str = ""
-    edit_assigned_to: str = ""
-
-    def set_edit_name(self, name: str):
-        """Set the edit name field."""
-        self.edit_name = name
-
-    def set_edit_date(self, date: str):
-        """Set the edit date field."""
-        self.edit_date = date
-
-    def set_edit_notes(self, notes: str):
-        """Set the edit notes field."""
-        self.edit_notes = notes
-
-    def set_edit_status(self, status: str):
-        """Set the edit status field."""
-        self.edit_status = status
-
-    def set_edit_assigned_to(self, assigned_to: str):
-        """Set the edit assigned_to field."""
-        self.edit_assigned_to = assigned_to
 
     def show_login_form(self):
         """Switch to login view."""
         self.show_signup = False
         self.signup_error = ""
         self.error_message = ""
-    
+
     def show_signup_form(self):
         """Switch to signup view."""
         self.show_signup = True
         self.error_message = ""
         self.signup_error = ""
-        
-    def open_edit_modal(self, task: Task):
-        """Open the edit modal for a task."""
-        self.editing_task = task
-        self.edit_name = task.name
-        self.edit_date = task.date
-        self.edit_notes = task.notes
-        self.edit_status = task.status
-        self.edit_assigned_to = task.assigned_to
-        self.show_edit_modal = True
 
-    def close_edit_modal(self):
-        """Close the edit modal."""
-        self.show_edit_modal = False
-        self.editing_task = None
-        self.edit_name = ""
-        self.edit_date = ""
-        self.edit_notes = ""
-        self.edit_status = ""
-        self.edit_assigned_to = ""
-
-    def logout(self):
+    async def logout(self):
         """Handle user logout."""
         self.is_authenticated = False
         self.current_user = None
+        (await self.get_state(TaskListState))._reset_tasks()
         self.error_message = ""
 
-    def set_role(self, role: str):
+    async def login(self, form_data: dict):
+        """Handle user login."""
+        username = form_data.get("username", "")
+        password = form_data.get("password", "")
+        
+        if not username or not password:
+            self.error_message = "Please enter both username and password."
+            return
+        
+        try:
+            async with rx.asession() as session:
+                user = (await session.exec(select(User).where(User.username == username))).first()
+                if user and await verify_password_async(password, user.password):
+                    if needs_rehash(user.password):
+                        # Upgrade legacy plaintext or outdated hashes on login
+                        user.password = await hash_password_async(password)
+                        session.add(user)
+                        await session.commit()
+                        await session.refresh(user)
+                    self.is_authenticated = True
+                    self.current_user = UserView.from_user(user, role="Assignee")
+                    self.error_message = ""
+                    task_list = await self.get_state(TaskListState)
+                    task_list._reset_tasks()
+                    await task_list._load_tasks(session)
+                    await task_list._load_counts(session)
+                    return TaskListState.watch_task_changes
+                else:
+                    self.error_message = "Invalid username or password."
+        except Exception as e:
+            self.error_message = "Error during login. Please try again."
+            print(f"Login error: {str(e)}")  # For debugging
+
+    async def signup(self, form_data: dict):
+        """Handle new user signup."""
+        username = form_data.get("username", "")
+        password = form_data.get("password", "")
+        confirm_password = form_data.get("confirm_password", "")
+        manager_password = form_data.get("manager_password", "")
+        
+        if not all([username, password, confirm_password, manager_password]):
+            self.signup_error = "All fields are required."
+            return
+            
+        if password != confirm_password:
+            self.signup_error = "Passwords do not match."
+            return
+            
+        try:
+            async with rx.asession() as session:
+                if (await session.exec(select(User).where(User.username == username))).first():
+                    self.signup_error = "Username already exists."
+                    return
+                    
+                new_user = User(
+                    username=username,
+                    password=await hash_password_async(password),
+                    role="Manager",  # First user is the manager
+                    manager_password=await hash_password_async(manager_password)
+                )
+                session.add(new_user)
+                await session.flush()
+                # Claim the tasks already assigned to this name
+                await session.exec(
+                    update(Task)
+                    .where(Task.assigned_to == username, Task.assignee_id.is_(None))
+                    .values(assignee_id=new_user.id)
+                )
+                await session.commit()
+                
+                # Refresh the user to get the ID
+                await session.refresh(new_user)
+                
+                # Auto login after signup
+                self.is_authenticated = True
+                self.current_user = UserView.from_user(new_user)
+                self.signup_error = ""
+                task_list = await self.get_state(TaskListState)
+                task_list._reset_tasks()
+                await task_list._load_counts(session)
+                self.show_signup = False
+                return TaskListState.watch_task_changes
+        except Exception as e:
+            self.signup_error = "Error creating user. Please try again."
+            print(f"Signup error: {str(e)}")  # For debugging
+
+
+class RoleModalState(AuthState):
+    """Switching between the Manager and Assignee roles."""
+
+    show_role_modal: bool = False
+    role_password: str = ""
+    role_modal_error: str = ""
+    selected_role: str = ""
+
+    async def set_role(self, role: str):
         """Handle role change."""
         if not self.current_user:
             return
@@ -125,205 +315,710 @@ class State(rx.State):
         else:
             # Directly switch to Assignee role or if already a Manager
             try:
-                with rx.session() as session:
-                    user = session.exec(select(User).where(User.id == self.current_user.id)).first()
-                    if user:
-                        user.role = role
-                        session.add(user)
-                        session.commit()
-                        # Create a new user object to trigger state update
-                        self.current_user = User(
-                            id=user.id,
-                            username=user.username,
-                            password=user.password,
-                            role=role,
-                            manager_password=user.manager_password
-                        )
+                async with rx.asession() as session:
+                    await session.exec(
+                        update(User).where(User.id == self.current_user.id).values(role=role)
+                    )
+                    await session.commit()
+                self.current_user = self.current_user.with_role(role)
+                if role == "Manager":
+                    await (await self.get_state(TaskListState))._show_owned_tasks()
             except Exception as e:
                 print(f"Error switching role: {str(e)}")
-    
-    def verify_role_password(self):
+
+    async def verify_role_password(self):
         """Verify the password for role switching."""
         if not self.current_user:
             return
             
         try:
-            with rx.session() as session:
-                user = session.exec(select(User).where(User.id == self.current_user.id)).first()
-                if not user:
+            async with rx.asession() as session:
+                # Only the credential being checked is loaded, never kept in state
+                manager_password = (await session.exec(
+                    select(User.manager_password).where(User.id == self.current_user.id)
+                )).first()
+                if manager_password is None:
                     return
                     
-                if self.role_password == user.manager_password:
-                    user.role = self.selected_role
-                    session.add(user)
-                    session.commit()
-                    # Create a new user object to trigger state update
-                    self.current_user = User(
-                        id=user.id,
-                        username=user.username,
-                        password=user.password,
-                        role=self.selected_role,
-                        manager_password=user.manager_password
+                if await verify_password_async(self.role_password, manager_password):
+                    values = {"role": self.selected_role}
+                    if needs_rehash(manager_password):
+                        values["manager_password"] = await hash_password_async(self.role_password)
+                    await session.exec(
+                        update(User).where(User.id == self.current_user.id).values(**values)
                     )
+                    await session.commit()
+                    self.current_user = self.current_user.with_role(self.selected_role)
+                    await (await self.get_state(TaskListState))._show_owned_tasks()
                     self.close_role_modal()
                 else:
                     self.role_modal_error = "Invalid password for Manager role."
         except Exception as e:
             print(f"Error verifying role password: {str(e)}")
             self.role_modal_error = "Error verifying password. Please try again."
-    
+
     def close_role_modal(self):
         """Close the role switch modal."""
         self.show_role_modal = False
         self.role_password = ""
         self.role_modal_error = ""
-        
+
     def set_role_password(self, password: str):
         """Update the role password field."""
         self.role_password = password
 
-    def add_item(self, form_data: dict):
+
+class TaskListState(AuthState):
+    """The current user's tasks: the loaded page, filters, bulk actions and import."""
+
+    # Tasks of the current user keyed by id, patched in place by task mutations
+    _tasks: dict[int, Task] = {}
+
+    # Pagination state: the cursor each visited page starts after, either a
+    # (value, id) keyset or, for search results, a row offset
+    _page_cursors: list[Any] = []
+    page: int = 1
+    has_next_page: bool = False
+
+    # Task filters and sort order, applied in the task query
+    filter_statuses: list[str] = []
+    filter_assigned_to: str = ""
+    # "owned" for the tasks of the user's group, "assigned" for the tasks assigned to them
+    task_view: str = "owned"
+    filter_date_from: str = ""
+    filter_date_to: str = ""
+    sort_by: str = "date"
+    search_query: str = ""
+
+    # Bulk import progress and the rejected rows of the last import
+    import_in_progress: bool = False
+    import_message: str = ""
+    import_errors: list[dict[str, str]] = []
+    _import_error_report: list[tuple[int, str]] = []
+    # The uploaded file run_import reads, set by handle_import
+    _import_path: str = ""
+
+    # Ids of the loaded tasks ticked for a bulk action
+    selected_task_ids: list[int] = []
+
+    # The current user's task totals shown above the table
+    task_counts: Optional[TaskCounts] = None
+
+    def _reset_tasks(self):
+        """Clear the loaded tasks and go back to the first page."""
+        self._tasks = {}
+        self.selected_task_ids = []
+        self._page_cursors = []
+        self.page = 1
+        self.has_next_page = False
+        self.filter_statuses = []
+        self.filter_assigned_to = ""
+        self.filter_date_from = ""
+        self.filter_date_to = ""
+        self.sort_by = "date"
+        self.search_query = ""
+        self.task_view = "owned"
+        self.task_counts = None
+
+    def _task_filters(self) -> list:
+        """Return the SQL conditions selecting the tasks to show."""
+        if self.task_view == "assigned":
+            conditions = [Task.assignee_id == self.current_user.id]
+        else:
+            conditions = [Task.owner_id == self.current_user.id]
+        if self.filter_statuses:
+            conditions.append(Task.status.in_([parse_status(status) for status in self.filter_statuses]))
+        if self.filter_assigned_to:
+            conditions.append(Task.assigned_to == self.filter_assigned_to)
+        date_from = parse_date(self.filter_date_from)
+        if date_from:
+            conditions.append(Task.date >= date_from)
+        date_to = parse_date(self.filter_date_to)
+        if date_to:
+            conditions.append(Task.date <= date_to)
+        return conditions
+
+    def _matches_filters(self, task: Task) -> bool:
+        """Check whether a task passes the current filters."""
+        if not self.current_user:
+            return False
+        if self.task_view == "assigned":
+            if task.assignee_id != self.current_user.id:
+                return False
+        elif task.owner_id != self.current_user.id:
+            return False
+        if self.filter_statuses and task.status.label not in self.filter_statuses:
+            return False
+        if self.filter_assigned_to and task.assigned_to != self.filter_assigned_to:
+            return False
+        date_from = parse_date(self.filter_date_from)
+        date_to = parse_date(self.filter_date_to)
+        if (date_from or date_to) and task.date is None:
+            return False
+        if date_from and task.date < date_from:
+            return False
+        if date_to and task.date > date_to:
+            return False
+        text = f"{task.name} {task.notes}".lower()
+        for word in search_words(self.search_query):
+            if not re.search(r"\b" + re.escape(word), text):
+                return False
+        return True
+
+    def _show_task(self, task: Task):
+        """Put a task in the loaded tasks, or drop it if it no longer matches the filters."""
+        if self._matches_filters(task):
+            self._tasks[task.id] = task
+        else:
+            self._tasks.pop(task.id, None)
+
+    async def _fetch_page(self, session, cursor: Any) -> list[Task]:
+        """Fetch one page of the current user's tasks after the cursor."""
+        words = search_words(self.search_query)
+        query = select(Task).where(*self._task_filters())
+        if words:
+            # Full text search within the user's tasks, paginated by offset
+            user_column = "assignee_id" if self.task_view == "assigned" else "owner_id"
+            query = query.join(task_fts, task_fts.c.rowid == Task.id).where(
+                task_fts_column.match(fts_query(words, user_column, self.current_user.id))
+            )
+            if min(len(word) for word in words) >= RANKED_WORD_LENGTH:
+                # Only name and notes count towards the rank
+                query = query.order_by(func.bm25(task_fts_column, 1.0, 1.0, 0.0, 0.0), Task.id)
+            else:
+                query = query.order_by(task_fts.c.rowid.desc())
+            query = query.offset(cursor or 0)
+        else:
+            column = SORT_COLUMNS[self.sort_by]
+            if cursor is not None:
+                query = query.where(after_cursor(column, cursor))
+            query = query.order_by(column, Task.id)
+        tasks = (await session.exec(query.limit(TASKS_PER_PAGE + 1))).all()
+        self.has_next_page = len(tasks) > TASKS_PER_PAGE
+        return tasks[:TASKS_PER_PAGE]
+
+    async def _load_tasks(self, session):
+        """Load the current page of the current user's tasks."""
+        if not self.current_user:
+            self._tasks = {}
+            return
+        cursor = self._page_cursors[-1] if self._page_cursors else None
+        tasks = await self._fetch_page(session, cursor)
+        self._tasks = {task.id: task for task in tasks}
+        self.selected_task_ids = []
+        self.page = len(self._page_cursors) + 1
+
+    async def _load_counts(self, session):
+        """Load the current user's task totals."""
+        self.task_counts = await get_counts(session, self.current_user.id) if self.current_user else None
+
+    async def _reload_tasks(self):
+        """Reload the first page of tasks after the filters or sort changed."""
+        self._page_cursors = []
+        try:
+            async with rx.asession() as session:
+                await self._load_tasks(session)
+        except Exception as e:
+            print(f"Error loading tasks: {str(e)}")
+
+    async def toggle_status_filter(self, status: str, checked: bool):
+        """Include or exclude a status from the task filter."""
+        statuses = [s for s in self.filter_statuses if s != status]
+        if checked:
+            statuses.append(status)
+        self.filter_statuses = statuses
+        await self._reload_tasks()
+
+    async def set_task_view(self, task_view: str):
+        """Switch between the group's tasks and the tasks assigned to the current user."""
+        if task_view not in ("owned", "assigned"):
+            return
+        self.task_view = task_view
+        await self._reload_tasks()
+
+    async def _show_owned_tasks(self):
+        """Go back to the group's tasks, e.g. when leaving the Assignee role."""
+        if self.task_view != "owned":
+            self.task_view = "owned"
+            await self._reload_tasks()
+
+    async def set_filter_assigned_to(self, assigned_to: str):
+        """Filter tasks by assignee."""
+        self.filter_assigned_to = assigned_to.strip()
+        await self._reload_tasks()
+
+    async def set_filter_date_from(self, date_from: str):
+        """Only show tasks due on or after a date."""
+        self.filter_date_from = date_from
+        await self._reload_tasks()
+
+    async def set_filter_date_to(self, date_to: str):
+        """Only show tasks due on or before a date."""
+        self.filter_date_to = date_to
+        await self._reload_tasks()
+
+    async def set_search_query(self, search_query: str):
+        """Search task names and notes."""
+        self.search_query = search_query
+        await self._reload_tasks()
+
+    async def set_sort_by(self, sort_by: str):
+        """Change the column tasks are sorted by."""
+        if sort_by not in SORT_COLUMNS:
+            return
+        self.sort_by = sort_by
+        await self._reload_tasks()
+
+    async def clear_filters(self):
+        """Remove all task filters."""
+        self.filter_statuses = []
+        self.filter_assigned_to = ""
+        self.filter_date_from = ""
+        self.filter_date_to = ""
+        self.search_query = ""
+        await self._reload_tasks()
+
+    def _last_cursor(self) -> Any:
+        """Return the cursor the page after the loaded tasks starts at."""
+        if not self._tasks:
+            return None
+        if search_words(self.search_query):
+            offset = self._page_cursors[-1] if self._page_cursors else 0
+            return offset + len(self._tasks)
+        last = max(self._tasks.values(), key=lambda task: task_sort_key(task, self.sort_by))
+        return (getattr(last, self.sort_by), last.id)
+
+    async def next_page(self):
+        """Show the next page of tasks."""
+        cursor = self._last_cursor()
+        if not self.has_next_page or cursor is None:
+            return
+        self._page_cursors.append(cursor)
+        try:
+            async with rx.asession() as session:
+                await self._load_tasks(session)
+        except Exception as e:
+            print(f"Error loading tasks: {str(e)}")
+
+    async def prev_page(self):
+        """Show the previous page of tasks."""
+        if not self._page_cursors:
+            return
+        self._page_cursors.pop()
+        try:
+            async with rx.asession() as session:
+                await self._load_tasks(session)
+        except Exception as e:
+            print(f"Error loading tasks: {str(e)}")
+
+    async def load_more(self):
+        """Append the next page of tasks to the ones already shown."""
+        cursor = self._last_cursor()
+        if not self.has_next_page or cursor is None:
+            return
+        try:
+            async with rx.asession() as session:
+                for task in await self._fetch_page(session, cursor):
+                    self._tasks[task.id] = task
+        except Exception as e:
+            print(f"Error loading tasks: {str(e)}")
+
+    @rx.event(background=True)
+    async def watch_task_changes(self):
+        """Apply published changes to the current user's tasks, including other sessions' edits."""
+        async with self:
+            user = self.current_user
+            token = self.router.session.client_token
+        if user is None or (token, user.id) in _task_watchers:
+            return
+        _task_watchers.add((token, user.id))
+        counted_on = date.today()
+        try:
+            async with get_bus().subscribe() as changes:
+                while session_connected(token):
+                    try:
+                        change = await asyncio.wait_for(changes.get(), WATCH_CHECK_INTERVAL)
+                    except asyncio.TimeoutError:
+                        change = None
+                    mine = change.addressed_to(user.id) if change is not None else []
+                    if change is not None and not mine:
+                        continue
+                    counts = None
+                    if any(change.owner_id == user.id for change in mine) or counted_on != date.today():
+                        # The totals changed, or overdue and due soon rolled over to a new day
+                        async with rx.asession() as session:
+                            counts = await get_counts(session, user.id)
+                        counted_on = counts.as_of
+                    async with self:
+                        if self.current_user is None or self.current_user.id != user.id:
+                            # Logged out or in as someone else
+                            break
+                        if counts is not None:
+                            self.task_counts = counts
+                        # A batch is applied in one state update
+                        for change in mine:
+                            if change.kind == "deleted":
+                                self._tasks.pop(change.task_id, None)
+                            elif change.kind == "reload":
+                                # Many tasks were written at once; fetch the current page again
+                                selected = self.selected_task_ids
+                                async with rx.asession() as session:
+                                    await self._load_tasks(session)
+                                self.selected_task_ids = [task_id for task_id in selected if task_id in self._tasks]
+                            elif change.task_id in self._tasks or self._matches_filters(Task(**change.task)):
+                                self._show_task(Task(**change.task))
+        finally:
+            _task_watchers.discard((token, user.id))
+
+    async def add_item(self, form_data: dict):
         """Add a new task."""
         if not self.current_user or self.current_user.role != "Manager":
             return
             
         try:
-            with rx.session() as session:
+            async with rx.asession() as session:
                 new_task = Task(
                     name=form_data.get("name", ""),
-                    date=form_data.get("date", ""),
+                    date=parse_date(form_data.get("date", "")),
                     notes=form_data.get("notes", ""),
-                    status=form_data.get("status", "Not Started"),
+                    status=parse_status(form_data.get("status")) or TaskStatus.NOT_STARTED,
                     assigned_to=form_data.get("assigned_to", ""),
                     owner_id=self.current_user.id
                 )
+                new_task.assignee_id = (await find_user_ids(session, [new_task.assigned_to])).get(new_task.assigned_to)
                 session.add(new_task)
-                session.commit()
-                # Force state update by refreshing current_user
-                self.current_user = session.exec(select(User).where(User.id == self.current_user.id)).first()
+                await update_counts(session, new_task.owner_id, added=[(new_task.status, new_task.date)])
+                await session.commit()
+                await session.refresh(new_task)
+                if self._matches_filters(new_task):
+                    self._tasks[new_task.id] = new_task
+                await self._load_counts(session)
+            await get_bus().publish(TaskChange.saved(new_task))
         except Exception as e:
             print(f"Error adding task: {str(e)}")
 
-    @rx.var
-    def current_tasks(self) -> list[Task]:
-        """Return tasks for the current user."""
-        if not self.current_user:
-            return []
+    async def handle_import(self, files: list[rx.UploadFile]):
+        """Save an uploaded import file and start importing it."""
+        if not self.current_user or self.current_user.role != "Manager":
+            return
+        if not files or self.import_in_progress:
+            return
+        upload = files[0]
+        suffix = Path(upload.name or "").suffix.lower()
+        path = import_dir() / f"task-import-{uuid.uuid4().hex}{suffix}"
+        with path.open("wb") as out:
+            while chunk := await upload.read(1024 * 1024):
+                out.write(chunk)
+        self.import_in_progress = True
+        self.import_message = "Importing..."
+        self.import_errors = []
+        self._import_error_report = []
+        self._import_path = str(path)
+        return TaskListState.run_import
+
+    @rx.event(background=True)
+    async def run_import(self):
+        """Insert the rows of the file saved by handle_import in batched transactions."""
+        async with self:
+            if not self._import_path:
+                return
+            path = Path(self._import_path)
+            self._import_path = ""
+            is_manager = self.current_user is not None and self.current_user.role == "Manager"
+            owner_id = self.current_user.id if is_manager else None
+        batch_size = import_batch_size()
+        imported = 0
+        errors: list[tuple[int, str]] = []
+        batch: list[dict] = []
         try:
-            with rx.session() as session:
-                tasks = session.exec(select(Task).where(Task.owner_id == self.current_user.id)).all()
-                return tasks
+            if owner_id is None:
+                raise RowError("Only managers can import tasks")
+            async with rx.asession() as session:
+                for number, row in iter_rows(path):
+                    try:
+                        batch.append({**validate_row(row), "owner_id": owner_id})
+                    except RowError as e:
+                        errors.append((number, str(e)))
+                        continue
+                    if len(batch) >= batch_size:
+                        await self._insert_batch(session, owner_id, batch)
+                        imported += len(batch)
+                        batch = []
+                        async with self:
+                            self.import_message = f"Imported {imported} tasks, {len(errors)} rows rejected..."
+                if batch:
+                    await self._insert_batch(session, owner_id, batch)
+                    imported += len(batch)
+        except RowError as e:
+            errors.append((0, str(e)))
         except Exception as e:
-            print(f"Error getting tasks: {str(e)}")
-            return []
+            errors.append((0, "Import stopped, see server log."))
+            print(f"Error importing tasks: {str(e)}")
+        finally:
+            remove_import_file(path)
 
-    def login(self, form_data: dict):
-        """Handle user login."""
-        username = form_data.get("username", "")
-        password = form_data.get("password", "")
-        
-        if not username or not password:
-            self.error_message = "Please enter both username and password."
+        async with self:
+            self.import_in_progress = False
+            self.import_message = f"Imported {imported} tasks, {len(errors)} rows rejected."
+            self._import_error_report = errors
+            self.import_errors = [
+                {"row": str(number), "error": message} for number, message in errors[:100]
+            ]
+            await self._reload_tasks()
+            async with rx.asession() as session:
+                await self._load_counts(session)
+
+    @classmethod
+    async def _insert_batch(cls, session, owner_id: int, batch: list[dict]):
+        """Insert and commit one batch of import rows, then tell the sessions showing them to reload."""
+        await cls._resolve_assignees(session, batch)
+        # One executemany INSERT per batch
+        await session.exec(insert(Task), params=batch)
+        await update_counts(session, owner_id, added=[(row["status"], row["date"]) for row in batch])
+        await session.commit()
+        # One change per batch rather than per row, for the owner and each assignee
+        await get_bus().publish(TaskChange.reload(owner_id))
+        for assignee_id in {row["assignee_id"] for row in batch} - {None, owner_id}:
+            await get_bus().publish(TaskChange.reload(owner_id, assignee_id))
+
+    @staticmethod
+    async def _resolve_assignees(session, rows: list[dict]):
+        """Set assignee_id on import rows with one user lookup per batch."""
+        user_ids = await find_user_ids(session, {row["assigned_to"] for row in rows})
+        for row in rows:
+            row["assignee_id"] = user_ids.get(row["assigned_to"])
+
+    def download_import_errors(self):
+        """Download the rejected rows of the last import as CSV."""
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["row", "error"])
+        writer.writerows(self._import_error_report)
+        return rx.download(data=out.getvalue(), filename="import_errors.csv")
+
+    def toggle_task_selected(self, task_id: int, checked: bool):
+        """Tick or untick a task for a bulk action."""
+        ids = [i for i in self.selected_task_ids if i != task_id]
+        if checked:
+            ids.append(task_id)
+        self.selected_task_ids = ids
+
+    def toggle_all_selected(self, checked: bool):
+        """Tick or untick every loaded task."""
+        self.selected_task_ids = list(self._tasks) if checked else []
+
+    def clear_selection(self):
+        """Untick all tasks."""
+        self.selected_task_ids = []
+
+    def _patch_tasks(self, ids: list[int], **values):
+        """Apply a bulk update to the loaded tasks and drop those no longer matching the filters."""
+        tasks = dict(self._tasks)
+        for task_id in ids:
+            task = tasks.get(task_id)
+            if task is None:
+                continue
+            for name, value in values.items():
+                setattr(task, name, value)
+            if not self._matches_filters(task):
+                del tasks[task_id]
+        self._tasks = tasks
+        self.selected_task_ids = []
+
+    async def bulk_set_status(self, label: str):
+        """Set the status of all selected tasks in one statement."""
+        ids = self.selected_task_ids
+        status = parse_status(label)
+        if not self.current_user or not ids or status is None:
             return
-        
         try:
-            with rx.session() as session:
-                user = session.exec(select(User).where(User.username == username)).first()
-                if user and user.password == password:
-                    self.is_authenticated = True
-                    user.role = "Assignee"
-                    self.current_user = user
-                    self.error_message = ""
-                else:
-                    self.error_message = "Invalid username or password."
+            async with rx.asession() as session:
+                # Assignees may also set the status of tasks assigned to them
+                scope = (
+                    Task.id.in_(ids),
+                    or_(Task.owner_id == self.current_user.id, Task.assignee_id == self.current_user.id),
+                )
+                previous = (await session.exec(select(Task.owner_id, Task.status, Task.date).where(*scope))).all()
+                await session.exec(update(Task).where(*scope).values(status=status))
+                for owner_id in {owner_id for owner_id, _, _ in previous if owner_id is not None}:
+                    await update_counts(
+                        session,
+                        owner_id,
+                        added=[(status, due) for owner, _, due in previous if owner == owner_id],
+                        removed=[(old, due) for owner, old, due in previous if owner == owner_id],
+                    )
+                await session.commit()
+                await self._load_counts(session)
+                changed = (await session.exec(select(Task).where(*scope))).all()
+            self._patch_tasks(ids, status=status)
+            await get_bus().publish(TaskChange.batch([TaskChange.saved(task) for task in changed]))
         except Exception as e:
-            self.error_message = "Error during login. Please try again."
-            print(f"Login error: {str(e)}")  # For debugging
+            print(f"Error updating tasks: {str(e)}")
 
-    def signup(self, form_data: dict):
-        """Handle new user signup."""
-        username = form_data.get("username", "")
-        password = form_data.get("password", "")
-        confirm_password = form_data.get("confirm_password", "")
-        manager_password = form_data.get("manager_password", "")
-        
-        if not all([username, password, confirm_password, manager_password]):
-            self.signup_error = "All fields are required."
+    async def bulk_reassign(self, form_data: dict):
+        """Assign all selected tasks to someone in one statement."""
+        ids = self.selected_task_ids
+        assigned_to = form_data.get("assigned_to", "").strip()
+        if not self.current_user or self.current_user.role != "Manager":
             return
-            
-        if password != confirm_password:
-            self.signup_error = "Passwords do not match."
+        if not ids or not assigned_to:
             return
-            
         try:
-            with rx.session() as session:
-                if session.exec(select(User).where(User.username == username)).first():
-                    self.signup_error = "Username already exists."
-                    return
-                    
-                new_user = User(
-                    username=username,
-                    password=password,  # In production, use hashed passwords
-                    role="Manager",  # First user is the manager
-                    manager_password=manager_password
-                )
-                session.add(new_user)
-                session.commit()
-                
-                # Refresh the user to get the ID
-                session.refresh(new_user)
-                
-                # Auto login after signup
-                self.is_authenticated = True
-                self.current_user = new_user
-                self.signup_error = ""
-                self.show_signup = False
+            async with rx.asession() as session:
+                assignee_id = (await find_user_ids(session, [assigned_to])).get(assigned_to)
+                scope = (Task.id.in_(ids), Task.owner_id == self.current_user.id)
+                await session.exec(update(Task).where(*scope).values(assigned_to=assigned_to, assignee_id=assignee_id))
+                await session.commit()
+                changed = (await session.exec(select(Task).where(*scope))).all()
+            self._patch_tasks(ids, assigned_to=assigned_to, assignee_id=assignee_id)
+            await get_bus().publish(TaskChange.batch([TaskChange.saved(task) for task in changed]))
         except Exception as e:
-            self.signup_error = "Error creating user. Please try again."
-            print(f"Signup error: {str(e)}")  # For debugging
+            print(f"Error reassigning tasks: {str(e)}")
 
-    def edit_item(self, form_data: dict):
-        """Handle task editing."""
-        if not self.editing_task or not self.current_user:
+    async def bulk_delete(self):
+        """Delete all selected tasks in one statement."""
+        ids = self.selected_task_ids
+        if not self.current_user or self.current_user.role != "Manager" or not ids:
             return
-            
         try:
-            with rx.session() as session:
-                task = session.exec(select(Task).where(Task.id == self.editing_task.id)).first()
-                if task:
-                    if self.current_user.role == "Manager":
-                        # Managers can edit all fields
-                        task.name = self.edit_name
-                        task.date = self.edit_date
-                        task.notes = self.edit_notes
-                        task.status = self.edit_status
-                        task.assigned_to = self.edit_assigned_to
-                    else:
-                        # Assignees can only edit status
-                        task.status = self.edit_status
-                    session.add(task)
-                    session.commit()
-                    # Force state update by refreshing current_user
-                    self.current_user = session.exec(select(User).where(User.id == self.current_user.id)).first()
-            self.close_edit_modal()
+            async with rx.asession() as session:
+                scope = (Task.id.in_(ids), Task.owner_id == self.current_user.id)
+                removed = (await session.exec(select(Task).where(*scope))).all()
+                await session.exec(delete(Task).where(*scope))
+                await update_counts(session, self.current_user.id, removed=[(task.status, task.date) for task in removed])
+                await session.commit()
+                await self._load_counts(session)
+            self._tasks = {task_id: task for task_id, task in self._tasks.items() if task_id not in ids}
+            self.selected_task_ids = []
+            await get_bus().publish(TaskChange.batch([TaskChange.deleted(task) for task in removed]))
         except Exception as e:
-            print(f"Error editing task: {str(e)}")
+            print(f"Error deleting tasks: {str(e)}")
 
-    def delete_item(self, task_id: int):
-        """Delete a task."""
+    @rx.var(cache=True, deps=["_tasks", "selected_task_ids"], auto_deps=False)
+    def all_tasks_selected(self) -> bool:
+        """Whether every loaded task is ticked."""
+        return bool(self._tasks) and set(self._tasks) <= set(self.selected_task_ids)
+
+    def export_tasks(self, fmt: str):
+        """Download the current user's tasks matching the status and date filters."""
+        if not self.current_user:
+            return
+        token = create_export(
+            self.current_user.id,
+            self.filter_statuses,
+            parse_date(self.filter_date_from),
+            parse_date(self.filter_date_to),
+        )
+        return rx.redirect(export_url(token, fmt))
+
+    @rx.var(cache=True, deps=["_tasks", "sort_by", "search_query"], auto_deps=False)
+    def current_tasks(self) -> list[Task]:
+        """Return the loaded tasks of the current user in page order."""
+        if search_words(self.search_query):
+            # Search results keep their rank order
+            return list(self._tasks.values())
+        return sorted(self._tasks.values(), key=lambda task: task_sort_key(task, self.sort_by))
+
+    async def delete_item(self, task_id: int):
+        """Delete a task, removing its row before the delete commits."""
         if not self.current_user or self.current_user.role != "Manager":
             return
-            
+
+        previous = self._tasks.pop(task_id, None)
+        if optimistic_updates():
+            yield
         try:
-            with rx.session() as session:
-                task = session.exec(select(Task).where(Task.id == task_id)).first()
+            async with rx.asession() as session:
+                task = (await session.exec(select(Task).where(Task.id == task_id))).first()
                 if task:
-                    session.delete(task)
-                    session.commit()
-                    # Force state update by refreshing current_user
-                    self.current_user = session.exec(select(User).where(User.id == self.current_user.id)).first()
+                    await session.delete(task)
+                    await update_counts(session, task.owner_id, removed=[(task.status, task.date)])
+                    await session.commit()
+                    await self._load_counts(session)
+                    await get_bus().publish(TaskChange.deleted(task))
         except Exception as e:
             print(f"Error deleting task: {str(e)}")
+            if previous is not None:
+                self._tasks[task_id] = previous
+            yield rx.toast.error("Could not delete the task.")
+
+
+class EditTaskState(TaskListState):
+    """The task edit modal.
+
+    The modal is an uncontrolled form seeded from editing_task, so typing
+    sends no events and all fields arrive together in edit_item.
+    """
+
+    show_edit_modal: bool = False
+    editing_task: Optional[Task] = None
+
+    def open_edit_modal(self, task: Task):
+        """Open the edit modal for a task."""
+        self.editing_task = task
+        self.show_edit_modal = True
+
+    def close_edit_modal(self):
+        """Close the edit modal."""
+        self.show_edit_modal = False
+        self.editing_task = None
+
+    def _edit_values(self, task: Task, form_data: dict) -> dict:
+        """Return the task fields the current user may change from the edit form."""
+        values = {}
+        if self.current_user.role == "Manager":
+            # Managers can edit all fields
+            values["name"] = form_data.get("name", task.name)
+            values["date"] = parse_date(form_data.get("date", ""))
+            values["legacy_date"] = None
+            values["notes"] = form_data.get("notes", task.notes)
+            values["assigned_to"] = form_data.get("assigned_to", task.assigned_to)
+        # Both roles can edit the status
+        status = parse_status(form_data.get("status"))
+        if status is not None:
+            values["status"] = status
+        return values
+
+    async def edit_item(self, form_data: dict):
+        """Handle task editing, showing the change before it commits."""
+        if not self.editing_task or not self.current_user:
+            return
+
+        task_id = self.editing_task.id
+        previous = self._tasks.get(task_id)
+        if previous is not None:
+            self._show_task(Task(**{**previous.model_dump(), **self._edit_values(previous, form_data)}))
+        self.close_edit_modal()
+        if optimistic_updates():
+            yield
+        try:
+            async with rx.asession() as session:
+                task = (await session.exec(select(Task).where(Task.id == task_id))).first()
+                if task is None:
+                    self._tasks.pop(task_id, None)
+                    yield rx.toast.error("The task no longer exists.")
+                    return
+                values = self._edit_values(task, form_data)
+                if "assigned_to" in values:
+                    user_ids = await find_user_ids(session, [values["assigned_to"]])
+                    values["assignee_id"] = user_ids.get(values["assigned_to"])
+                removed = (task.status, task.date)
+                for name, value in values.items():
+                    setattr(task, name, value)
+                session.add(task)
+                await update_counts(session, task.owner_id, added=[(task.status, task.date)], removed=[removed])
+                await session.commit()
+                await session.refresh(task)
+                self._show_task(task)
+                await self._load_counts(session)
+            await get_bus().publish(TaskChange.saved(task))
+        except Exception as e:
+            print(f"Error editing task: {str(e)}")
+            self._tasks.pop(task_id, None)
+            if previous is not None:
+                self._tasks[task_id] = previous
+            yield rx.toast.error("Could not save the task.")
+
 
 def create_initial_data():
     """Initialize the database with sample data."""
@@ -334,8 +1029,8 @@ def create_initial_data():
             # Create test user
             test_user = User(
                 username="testuser",
-                password="test123",  # In production, use hashed passwords
-                manager_password="manager123"
+                password=hash_password("test123"),
+                manager_password=hash_password("manager123")
             )
             session.add(test_user)
             session.commit()
@@ -343,18 +1038,20 @@ def create_initial_data():
             # Add some sample tasks
             task1 = Task(
                 name="Complete Project",
-                date="2024-03-20",
+                date=date(2024, 3, 20),
                 notes="Finish the todo app project",
-                status="In Progress",
+                status=TaskStatus.IN_PROGRESS,
                 assigned_to="testuser",
+                assignee_id=test_user.id,
                 owner_id=test_user.id
             )
             task2 = Task(
                 name="Test Database",
-                date="2024-03-21",
+                date=date(2024, 3, 21),
                 notes="Test all database operations",
-                status="Not Started",
+                status=TaskStatus.NOT_STARTED,
                 assigned_to="testuser",
+                assignee_id=test_user.id,
                 owner_id=test_user.id
             )
             session.add(task1)
@@ -367,7 +1064,7 @@ def create_initial_data():
             # Create test assignee
             test_assignee = User(
                 username="assignee",
-                password="assignee123",
+                password=hash_password("assignee123"),
                 manager_password=""
             )
             session.add(test_assignee)
@@ -383,33 +1080,36 @@ def _badge(icon: str, text: str, color_scheme: str):
         size="3",
     )
 
-def status_badge(status: str):
-    badge_mapping = {
-        "Completed": ("check", "Completed", "green"),
-        "In Progress": ("loader", "In Progress", "yellow"),
-        "Not Started": ("ban", "Not Started", "red"),
-    }
-    return _badge(*badge_mapping.get(status, ("loader", "In progress", "yellow")))
+# Badge icon and color of each status
+STATUS_BADGES = {
+    TaskStatus.COMPLETED: ("check", "green"),
+    TaskStatus.IN_PROGRESS: ("loader", "yellow"),
+    TaskStatus.NOT_STARTED: ("ban", "red"),
+}
+
+def status_badge(status: TaskStatus):
+    icon, color_scheme = STATUS_BADGES[status]
+    return _badge(icon, status.label, color_scheme)
 
 def role_switcher():
     return rx.cond(
-        State.current_user != None,
+        AuthState.current_user != None,
         rx.select(
             ["Manager", "Assignee"],
             placeholder="Switch Role",
             value=rx.cond(
-                State.current_user != None,
-                State.current_user.role,
+                AuthState.current_user != None,
+                AuthState.current_user.role,
                 "Assignee"
             ),
-            on_change=State.set_role,
+            on_change=RoleModalState.set_role,
         ),
         rx.box(),  # Empty box when no user is logged in
     )
 
 def role_modal():
     return rx.cond(
-        State.show_role_modal,
+        RoleModalState.show_role_modal,
         rx.box(
             rx.vstack(
                 rx.card(
@@ -418,26 +1118,26 @@ def role_modal():
                         rx.divider(),
                         rx.text("Manager role requires password verification."),
                         rx.cond(
-                            State.role_modal_error != "",
-                            rx.text(State.role_modal_error, color="red", margin_bottom="1em")
+                            RoleModalState.role_modal_error != "",
+                            rx.text(RoleModalState.role_modal_error, color="red", margin_bottom="1em")
                         ),
                         rx.input(
                             placeholder="Enter manager password",
                             type="password",
-                            on_change=State.set_role_password,
-                            value=State.role_password,
+                            on_change=RoleModalState.set_role_password,
+                            value=RoleModalState.role_password,
                             width="100%",
                             margin_bottom="1em",
                         ),
                         rx.hstack(
                             rx.button(
                                 "Cancel",
-                                on_click=State.close_role_modal,
+                                on_click=RoleModalState.close_role_modal,
                                 color_scheme="gray",
                             ),
                             rx.button(
                                 "Verify",
-                                on_click=State.verify_role_password,
+                                on_click=RoleModalState.verify_role_password,
                                 color_scheme="green",
                             ),
                             justify="end",
@@ -465,16 +1165,31 @@ def role_modal():
 
 def show_item(task: Task):
     return rx.table.row(
+        rx.table.cell(
+            rx.checkbox(
+                checked=TaskListState.selected_task_ids.contains(task.id),
+                on_change=lambda checked: TaskListState.toggle_task_selected(task.id, checked),
+            )
+        ),
         rx.table.cell(task.name),
-        rx.table.cell(task.date),
+        rx.table.cell(
+            rx.cond(
+                task.date,
+                rx.vstack(
+                    rx.text(task.date),
+                    countdown_component(due=task.date.to(str)),
+                    spacing="1",
+                    align_items="start",
+                ),
+                rx.text(task.legacy_date, color="gray"),
+            )
+        ),
         rx.table.cell(task.notes),
         rx.table.cell(
             rx.match(
                 task.status,
-                ("Completed", status_badge("Completed")),
-                ("In Progress", status_badge("In Progress")),
-                ("Not Started", status_badge("Not Started")),
-                status_badge("Not Started"),
+                *[(status.value, status_badge(status)) for status in TaskStatus],
+                status_badge(TaskStatus.NOT_STARTED),
             )
         ),
         rx.table.cell(task.assigned_to),
@@ -484,15 +1199,15 @@ def show_item(task: Task):
                     "Edit",
                     color_scheme="blue",
                     size="2",
-                    on_click=lambda: State.open_edit_modal(task),
+                    on_click=lambda: EditTaskState.open_edit_modal(task),
                 ),
                 rx.cond(
-                    (State.current_user != None) & (State.current_user.role == "Manager"),
+                    (AuthState.current_user != None) & (AuthState.current_user.role == "Manager"),
             rx.button(
                 "Delete",
                 color_scheme="red",
                 size="2",
-                        on_click=lambda: State.delete_item(task.id),
+                        on_click=lambda: TaskListState.delete_item(task.id),
                     ),
                 ),
                 spacing="2",
@@ -507,7 +1222,7 @@ def add_item_form():
             rx.input(type="date", name="date", required=True),
             rx.input(placeholder="Notes", name="notes"),
             rx.select(
-                ["Completed", "In Progress", "Not Started"],
+                STATUSES,
                 name="status",
                 placeholder="Status",
                 required=True,
@@ -515,18 +1230,75 @@ def add_item_form():
             rx.input(placeholder="Assigned To", name="assigned_to", required=True),  # NEW
             rx.button("Add", type="submit", color_scheme="green", size="2"),
         ),
-        on_submit=State.add_item,
+        on_submit=TaskListState.add_item,
         reset_on_submit=True,
         padding_x = "2em",
     )
 
+def import_panel():
+    return rx.vstack(
+        rx.hstack(
+            rx.upload(
+                rx.text("Drop a CSV, JSON or JSON Lines file of tasks, or click to select"),
+                id="task_import",
+                accept={
+                    "text/csv": [".csv"],
+                    "application/json": [".json", ".jsonl"],
+                },
+                max_files=1,
+                border="1px dashed var(--gray-7)",
+                padding="0.75em",
+            ),
+            rx.text(rx.selected_files("task_import").join(", ")),
+            rx.button(
+                "Import",
+                color_scheme="green",
+                size="2",
+                loading=TaskListState.import_in_progress,
+                on_click=TaskListState.handle_import(rx.upload_files(upload_id="task_import")),
+            ),
+            align="center",
+            spacing="4",
+        ),
+        rx.cond(
+            TaskListState.import_message != "",
+            rx.text(TaskListState.import_message, size="2"),
+        ),
+        rx.cond(
+            TaskListState.import_errors.length() > 0,
+            rx.hstack(
+                rx.vstack(
+                    rx.foreach(
+                        TaskListState.import_errors,
+                        lambda error: rx.text(
+                            f"Row {error['row']}: {error['error']}",
+                            color="red",
+                            size="1",
+                        ),
+                    ),
+                    max_height="8em",
+                    overflow_y="auto",
+                    spacing="0",
+                ),
+                rx.button(
+                    "Download error report",
+                    variant="soft",
+                    size="1",
+                    on_click=TaskListState.download_import_errors,
+                ),
+                align="start",
+            ),
+        ),
+        padding_x="2em",
+    )
+
 def signup_form():
     return rx.center(
         rx.vstack(
             rx.heading("Create New Group", size="6", margin_bottom="1em"),
             rx.cond(
-                State.signup_error != "",
-                rx.text(State.signup_error, color="red", margin_bottom="1em")
+                AuthState.signup_error != "",
+                rx.text(AuthState.signup_error, color="red", margin_bottom="1em")
             ),
             rx.form(
                 rx.vstack(
@@ -569,12 +1341,12 @@ def signup_form():
                         color_scheme="gray",
                         size="3",
                         width="100%",
-                        on_click=State.show_login_form,
+                        on_click=AuthState.show_login_form,
                     ),
                     spacing="4",
                     width="300px",
                 ),
-                on_submit=State.signup,
+                on_submit=AuthState.signup,
             ),
             width="400px",
             padding="2em",
@@ -591,8 +1363,8 @@ def login_form():
         rx.vstack(
             rx.heading("Task Management Login", size="6", margin_bottom="1em"),
             rx.cond(
-                State.error_message != "",
-                rx.text(State.error_message, color="red", margin_bottom="1em")
+                AuthState.error_message != "",
+                rx.text(AuthState.error_message, color="red", margin_bottom="1em")
             ),
             rx.form(
                 rx.vstack(
@@ -622,12 +1394,12 @@ def login_form():
                         color_scheme="blue",
                         size="3",
                         width="100%",
-                        on_click=State.show_signup_form,
+                        on_click=AuthState.show_signup_form,
                     ),
                     spacing="4",
                     width="300px",
                 ),
-                on_submit=State.login,
+                on_submit=AuthState.login,
             ),
             width="400px",
             padding="2em",
@@ -644,8 +1416,8 @@ def navbar():
         rx.badge(
             rx.icon(tag="list-todo", size=28),
             rx.cond(
-                State.current_user,
-                rx.heading(f"Welcome to {State.current_user.username}'s To-Do List", size="6"),
+                AuthState.current_user,
+                rx.heading(f"Welcome to {AuthState.current_user.username}'s To-Do List", size="6"),
                 rx.heading("Welcome to Guest's To-Do List", size="6"),
             ),
             color_scheme="green",
@@ -669,7 +1441,7 @@ def navbar():
                 "Logout",
                 color_scheme="red",
                 size="2",
-                on_click=State.logout,
+                on_click=AuthState.logout,
             ),
             spacing="6",  # More space between color mode group and Logout
             align="center",
@@ -684,10 +1456,190 @@ def navbar():
         padding_x="2em",
     )
 
+def status_filter_checkbox(status: str):
+    return rx.checkbox(
+        status,
+        checked=TaskListState.filter_statuses.contains(status),
+        on_change=lambda checked: TaskListState.toggle_status_filter(status, checked),
+    )
+
+def summary_stat(label: str, value, color_scheme: str):
+    return rx.card(
+        rx.vstack(
+            rx.text(label, size="2", color_scheme="gray"),
+            rx.heading(value, size="6", color_scheme=color_scheme),
+            spacing="1",
+        ),
+        min_width="9em",
+    )
+
+def summary_header():
+    counts = TaskListState.task_counts
+    return rx.cond(
+        counts,
+        rx.hstack(
+            *[
+                summary_stat(status.label, getattr(counts, STATUS_COUNTERS[status]), STATUS_BADGES[status][1])
+                for status in TaskStatus
+            ],
+            summary_stat("Overdue", counts.overdue, "red"),
+            summary_stat("Due tomorrow", counts.due_soon, "orange"),
+            spacing="4",
+            wrap="wrap",
+            padding_x="2em",
+        ),
+    )
+
+def filter_bar():
+    return rx.hstack(
+        rx.cond(
+            AuthState.current_user.role == "Assignee",
+            rx.select.root(
+                rx.select.trigger(),
+                rx.select.content(
+                    rx.select.item("Group tasks", value="owned"),
+                    rx.select.item("Assigned to me", value="assigned"),
+                ),
+                value=TaskListState.task_view,
+                on_change=TaskListState.set_task_view,
+            ),
+        ),
+        rx.input(
+            rx.input.slot(rx.icon("search", size=16)),
+            placeholder="Search tasks",
+            value=TaskListState.search_query,
+            on_change=TaskListState.set_search_query,
+            debounce_timeout=300,
+        ),
+        *[status_filter_checkbox(status) for status in STATUSES],
+        rx.input(
+            placeholder="Assigned To",
+            value=TaskListState.filter_assigned_to,
+            on_change=TaskListState.set_filter_assigned_to,
+        ),
+        rx.hstack(
+            rx.text("Due", size="2"),
+            rx.input(
+                type="date",
+                value=TaskListState.filter_date_from,
+                on_change=TaskListState.set_filter_date_from,
+            ),
+            rx.text("to", size="2"),
+            rx.input(
+                type="date",
+                value=TaskListState.filter_date_to,
+                on_change=TaskListState.set_filter_date_to,
+            ),
+            spacing="2",
+            align="center",
+        ),
+        rx.select(
+            list(SORT_COLUMNS),
+            value=TaskListState.sort_by,
+            on_change=TaskListState.set_sort_by,
+        ),
+        rx.button(
+            "Clear",
+            color_scheme="gray",
+            variant="soft",
+            size="2",
+            on_click=TaskListState.clear_filters,
+        ),
+        rx.menu.root(
+            rx.menu.trigger(
+                rx.button(rx.icon("download", size=16), "Export", variant="soft", size="2"),
+            ),
+            rx.menu.content(
+                rx.menu.item("CSV", on_click=TaskListState.export_tasks("csv")),
+                rx.menu.item("JSON", on_click=TaskListState.export_tasks("json")),
+            ),
+        ),
+        spacing="4",
+        align="center",
+        wrap="wrap",
+        padding_x="2em",
+    )
+
+def bulk_actions_bar():
+    is_manager = (AuthState.current_user != None) & (AuthState.current_user.role == "Manager")
+    return rx.cond(
+        TaskListState.selected_task_ids.length() > 0,
+        rx.hstack(
+            rx.text(f"{TaskListState.selected_task_ids.length()} selected", weight="bold"),
+            rx.select(
+                STATUSES,
+                placeholder="Set status",
+                value="",
+                on_change=TaskListState.bulk_set_status,
+            ),
+            rx.cond(
+                is_manager,
+                rx.hstack(
+                    rx.form(
+                        rx.hstack(
+                            rx.input(placeholder="Reassign to", name="assigned_to", required=True),
+                            rx.button("Reassign", type="submit", size="2"),
+                        ),
+                        on_submit=TaskListState.bulk_reassign,
+                        reset_on_submit=True,
+                    ),
+                    rx.button(
+                        "Delete",
+                        color_scheme="red",
+                        size="2",
+                        on_click=TaskListState.bulk_delete,
+                    ),
+                    align="center",
+                ),
+            ),
+            rx.button(
+                "Clear selection",
+                color_scheme="gray",
+                variant="soft",
+                size="2",
+                on_click=TaskListState.clear_selection,
+            ),
+            spacing="4",
+            align="center",
+            padding_x="2em",
+        ),
+    )
+
+def pagination_controls():
+    return rx.hstack(
+        rx.button(
+            "Previous",
+            color_scheme="gray",
+            size="2",
+            disabled=TaskListState.page <= 1,
+            on_click=TaskListState.prev_page,
+        ),
+        rx.text(f"Page {TaskListState.page}"),
+        rx.button(
+            "Next",
+            color_scheme="gray",
+            size="2",
+            disabled=~TaskListState.has_next_page,
+            on_click=TaskListState.next_page,
+        ),
+        rx.button(
+            "Load more",
+            variant="soft",
+            size="2",
+            disabled=~TaskListState.has_next_page,
+            on_click=TaskListState.load_more,
+        ),
+        spacing="4",
+        align="center",
+        justify="center",
+        width="100%",
+        padding_bottom="2em",
+    )
+
 def edit_modal():
     """Modal for editing tasks."""
     return rx.cond(
-        State.show_edit_modal,
+        EditTaskState.show_edit_modal,
         rx.box(
             rx.vstack(
                 rx.card(
@@ -697,51 +1649,50 @@ def edit_modal():
                         rx.form(
                             rx.vstack(
                                 rx.cond(
-                                    (State.current_user != None) & (State.current_user.role == "Manager"),
+                                    (AuthState.current_user != None) & (AuthState.current_user.role == "Manager"),
                                     rx.vstack(
                                         rx.input(
                                             placeholder="Task",
                                             name="name",
                                             required=True,
-                                            value=State.edit_name,
-                                            on_change=State.set_edit_name,
+                                            default_value=EditTaskState.editing_task.name,
                                         ),
                                         rx.input(
                                             type="date",
                                             name="date",
                                             required=True,
-                                            value=State.edit_date,
-                                            on_change=State.set_edit_date,
+                                            default_value=EditTaskState.editing_task.date.to(str),
                                         ),
                                         rx.input(
                                             placeholder="Notes",
                                             name="notes",
-                                            value=State.edit_notes,
-                                            on_change=State.set_edit_notes,
+                                            default_value=EditTaskState.editing_task.notes,
                                         ),
                                         rx.input(
                                             placeholder="Assigned To",
                                             name="assigned_to",
                                             required=True,
-                                            value=State.edit_assigned_to,
-                                            on_change=State.set_edit_assigned_to,
+                                            default_value=EditTaskState.editing_task.assigned_to,
                                         ),
                                     ),
                                     rx.text("Update task status:", margin_bottom="1em"),
                                 ),
                                 # Status field shown for both roles
                                 rx.select(
-                                    ["Completed", "In Progress", "Not Started"],
+                                    STATUSES,
                                     name="status",
                                     placeholder="Status",
                                     required=True,
-                                    value=State.edit_status,
-                                    on_change=State.set_edit_status,
+                                    default_value=rx.match(
+                                        EditTaskState.editing_task.status,
+                                        *[(status.value, status.label) for status in TaskStatus],
+                                        TaskStatus.NOT_STARTED.label,
+                                    ),
                                 ),
                                 rx.hstack(
                                     rx.button(
                                         "Cancel",
-                                        on_click=State.close_edit_modal,
+                                        on_click=EditTaskState.close_edit_modal,
                                         color_scheme="gray",
                                     ),
                                     rx.button(
@@ -755,7 +1706,8 @@ def edit_modal():
                                 spacing="4",
                                 width="100%",
                             ),
-                            on_submit=State.edit_item,
+                            on_submit=EditTaskState.edit_item,
+                            key=EditTaskState.editing_task.id,
                         ),
                     ),
                     width="400px",
@@ -781,13 +1733,22 @@ def dashboard():
     return rx.vstack(
         navbar(),
         rx.cond(
-            (State.current_user != None) & (State.current_user.role == "Manager"),
-            add_item_form(),
+            (AuthState.current_user != None) & (AuthState.current_user.role == "Manager"),
+            rx.vstack(add_item_form(), import_panel()),
             rx.text("You do not have permission to assign or delete tasks.", color="red", padding_x = "2em"),
         ),
+        summary_header(),
+        filter_bar(),
+        bulk_actions_bar(),
         rx.table.root(
             rx.table.header(
                 rx.table.row(
+                    rx.table.column_header_cell(
+                        rx.checkbox(
+                            checked=TaskListState.all_tasks_selected,
+                            on_change=TaskListState.toggle_all_selected,
+                        )
+                    ),
                     rx.table.column_header_cell(rx.icon("clipboard-list"),"Task"),
                     rx.table.column_header_cell(rx.icon("calendar-1"),"Date"),
                     rx.table.column_header_cell(rx.icon("notebook-pen"),"Notes"),
@@ -797,24 +1758,29 @@ def dashboard():
                 ),
             ),
             rx.table.body(
-                rx.foreach(State.current_tasks, show_item),
+                rx.foreach(TaskListState.current_tasks, show_item),
             ),
             width="100%",
         ),
+        pagination_controls(),
         role_modal(),
         edit_modal(),
     )
 
 def index():
     return rx.cond(
-        State.is_authenticated,
+        AuthState.is_authenticated,
         dashboard(),
         rx.cond(
-            State.show_signup,
+            AuthState.show_signup,
             signup_form(),
             login_form(),
         ),
     )
 
+configure_database()
 app = rx.App()
-app.add_page(index)
+# Resume watching for task changes after a page reload or reconnect
+app.add_page(index, on_load=TaskListState.watch_task_changes)
+register_export_routes(app)
+app.register_lifespan_task(reconcile_task_counts)
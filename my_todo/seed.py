@@ -0,0 +1,217 @@
+"""Generate a synthetic dataset for load testing and profiling.
+
+Creates --users users, a --managers share of them managers with a team of
+assignees each, and --tasks tasks owned by the managers. Task owners follow a
+Pareto distribution, so a few managers own most tasks; past due dates are
+mostly completed and future ones mostly open; note lengths are log-normal.
+Rows are written with executemany INSERTs in batches of --batch-size inside
+one transaction, after migrating the database to the latest revision. The
+task_fts triggers are dropped during the load and the index rebuilt once at
+the end, which is several times faster than indexing row by row. Dashboard
+counters of the new users are filled in on first read.
+
+The same --seed and --anchor (the day due dates are spread around, today by
+default) always produce the same rows. All seeded users share the password
+given with --password.
+
+Usage:
+    python -m my_todo.seed todo.db --users 1000 --tasks 1000000 --seed 1
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+from typing import Any, Iterator, Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import func, insert, select, text
+
+from .auth import hash_password
+from .db import create_engine
+from .models import Task, TaskStatus, User
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+VERBS = [
+    "Review", "Update", "Prepare", "Draft", "Fix", "Plan", "Schedule", "Test",
+    "Deploy", "Audit", "Migrate", "Document", "Follow up on", "Clean up",
+]
+NOUNS = [
+    "report", "invoice", "budget", "release", "contract", "roadmap", "survey",
+    "backup", "server", "onboarding", "meeting notes", "client feedback",
+    "training plan", "hiring pipeline", "launch checklist", "design review",
+]
+WORDS = [
+    "the", "a", "with", "for", "before", "after", "client", "team", "draft",
+    "numbers", "deadline", "check", "update", "send", "call", "review", "final",
+    "version", "notes", "meeting", "budget", "issue", "ticket", "approve",
+    "pending", "blocked", "waiting", "on", "finance", "legal", "sign-off",
+]
+
+# Status weights (not started, in progress, completed) by due date
+PAST_STATUS_WEIGHTS = (8, 12, 80)
+OPEN_STATUS_WEIGHTS = (55, 35, 10)
+STATUS_ORDER = (TaskStatus.NOT_STARTED, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED)
+
+
+def migrate(url: str):
+    """Bring the database at url to the latest schema revision."""
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    config.set_main_option("sqlalchemy.url", url)
+    command.upgrade(config, "head")
+
+
+def generate_users(
+    rng: random.Random, count: int, first_id: int, prefix: str, password: str, managers: float
+) -> tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]:
+    """Return the user rows and each manager's team, keyed by manager id."""
+    password_hash = hash_password(password, salt=rng.randbytes(16))
+    manager_count = max(1, round(count * managers))
+    users = [
+        {
+            "id": first_id + i,
+            "username": f"{prefix}{i + 1}",
+            "password": password_hash,
+            "role": "Manager" if i < manager_count else "Assignee",
+            "manager_password": password_hash if i < manager_count else "",
+        }
+        for i in range(count)
+    ]
+    teams = {user["id"]: [user] for user in users[:manager_count]}
+    manager_ids = list(teams)
+    for user in users[manager_count:]:
+        teams[rng.choice(manager_ids)].append(user)
+    return users, teams
+
+
+def due_date(rng: random.Random, anchor: date) -> Optional[date]:
+    """Pick a due date: mostly recent past, some upcoming, a few undated."""
+    roll = rng.random()
+    if roll < 0.03:
+        return None
+    if roll < 0.63:
+        return anchor - timedelta(days=min(int(rng.expovariate(1 / 45)), 730))
+    return anchor + timedelta(days=min(int(rng.expovariate(1 / 20)), 365))
+
+
+def notes(rng: random.Random) -> str:
+    """Write notes with a log-normal word count; some tasks have none."""
+    if rng.random() < 0.15:
+        return ""
+    words = min(int(rng.lognormvariate(2.5, 1.0)) + 1, 400)
+    return " ".join(rng.choices(WORDS, k=words)).capitalize() + "."
+
+
+def generate_tasks(
+    rng: random.Random, count: int, teams: dict[int, list[dict[str, Any]]], anchor: date
+) -> Iterator[dict[str, Any]]:
+    """Yield task rows, spread over the managers with a Pareto skew."""
+    manager_ids = list(teams)
+    weights = [rng.paretovariate(1.16) for _ in manager_ids]
+    owners = rng.choices(manager_ids, weights, k=count)
+    for owner_id in owners:
+        due = due_date(rng, anchor)
+        status_weights = PAST_STATUS_WEIGHTS if due is not None and due < anchor else OPEN_STATUS_WEIGHTS
+        if rng.random() < 0.05:
+            # Someone without an account
+            assigned_to, assignee_id = f"contractor{rng.randint(1, 50)}", None
+        else:
+            assignee = rng.choice(teams[owner_id])
+            assigned_to, assignee_id = assignee["username"], assignee["id"]
+        yield {
+            "name": f"{rng.choice(VERBS)} {rng.choice(NOUNS)}",
+            "date": due,
+            "notes": notes(rng),
+            "status": rng.choices(STATUS_ORDER, status_weights)[0],
+            "assigned_to": assigned_to,
+            "assignee_id": assignee_id,
+            "owner_id": owner_id,
+        }
+
+
+def batches(rows: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def seed(
+    path: str,
+    users: int,
+    tasks: int,
+    seed: int = 0,
+    anchor: Optional[date] = None,
+    managers: float = 0.1,
+    prefix: str = "user",
+    password: str = "password",
+    batch_size: int = 10_000,
+):
+    """Write a synthetic dataset into the SQLite database at path."""
+    url = f"sqlite:///{path}"
+    migrate(url)
+    rng = random.Random(seed)
+    anchor = anchor or date.today()
+    engine = create_engine(url)
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        taken = conn.execute(
+            select(func.count()).select_from(User).where(User.username.like(f"{prefix}%"))
+        ).scalar()
+        if taken:
+            raise SystemExit(f"{path} already has users named {prefix}*, pick another --prefix")
+        first_id = (conn.execute(select(func.max(User.id))).scalar() or 0) + 1
+        user_rows, teams = generate_users(rng, users, first_id, prefix, password, managers)
+        conn.execute(insert(User), user_rows)
+        triggers = conn.execute(text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'task_fts_%'"
+        )).all()
+        for name, _ in triggers:
+            conn.execute(text(f"DROP TRIGGER {name}"))
+        for batch in batches(generate_tasks(rng, tasks, teams, anchor), batch_size):
+            conn.execute(insert(Task), batch)
+        conn.execute(text("INSERT INTO task_fts(task_fts) VALUES ('rebuild')"))
+        for _, sql in triggers:
+            conn.execute(text(sql))
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    print(
+        f"Seeded {users} users ({len(teams)} managers) and {tasks} tasks due around {anchor} "
+        f"into {path} in {elapsed:.1f} s ({tasks / max(elapsed, 1e-9):,.0f} tasks/s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database", help="SQLite file to create or add to")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--anchor", type=date.fromisoformat, default=None, help="YYYY-MM-DD, default today")
+    parser.add_argument("--managers", type=float, default=0.1, help="share of users who are managers")
+    parser.add_argument("--prefix", default="user", help="username prefix")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+    seed(
+        args.database,
+        args.users,
+        args.tasks,
+        seed=args.seed,
+        anchor=args.anchor,
+        managers=args.managers,
+        prefix=args.prefix,
+        password=args.password,
+        batch_size=args.batch_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
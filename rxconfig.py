@@ -3,5 +3,7 @@ import reflex as rx
 config = rx.Config(
     app_name="my_todo",
     db_url="sqlite:///todo.db",  # Use SQLite database
+    async_db_url="sqlite+aiosqlite:///todo.db",  # Same database, used by rx.asession()
+    db_profile="default",  # "production" enables WAL, SQLite pragmas and a sized pool
     env=rx.Env.DEV,
 )
\ No newline at end of file